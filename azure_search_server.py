@@ -12,6 +12,7 @@ from azure_search_server_core import (
     AzureSearchClient,
     format_results,
     initialize_runtime,
+    register_multi_search_tool,
     register_search_tool,
     run_server,
     _coalesce,
@@ -36,6 +37,7 @@ def _get_search_client():
 
 
 search = register_search_tool(mcp, _get_search_client)
+multi_search = register_multi_search_tool(mcp, search)
 
 _format_results_as_json = format_results
 
@@ -51,6 +53,7 @@ __all__ = [
     "mcp",
     "search_client",
     "search",
+    "multi_search",
     "main",
     "_format_results_as_json",
     "format_results",
@@ -22,13 +22,14 @@ from .utils import (
     _try_parse_int,
     _vector_field_selector,
 )
-from .tools.search import register_search_tool
+from .tools.search import register_multi_search_tool, register_search_tool
 
 __all__ = [
     "AzureSearchClient",
     "format_results",
     "initialize_runtime",
     "run_server",
+    "register_multi_search_tool",
     "register_search_tool",
     "_coalesce",
     "_ensure_list_of_floats",
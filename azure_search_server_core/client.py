@@ -2,39 +2,397 @@
 
 from __future__ import annotations
 
-import os
-import sys
-from typing import Any, Dict, List, Optional, Sequence
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import requests  # type: ignore[import]
 from azure.core.credentials import AzureKeyCredential  # type: ignore[import]
+from azure.core.pipeline.transport import RequestsTransport  # type: ignore[import]
 from azure.search.documents import SearchClient  # type: ignore[import]
 from azure.search.documents.models import VectorizableTextQuery  # type: ignore[import]
+from requests.adapters import HTTPAdapter  # type: ignore[import]
+from urllib3.util.retry import Retry  # type: ignore[import]
 
+from .cache import _SingleFlight, _TTLCache
+from .config import _ClientDefaults, _load_defaults
+from .semantic_cache import _SemanticCache, _create_semantic_cache
+from .throttle import _RequestGate, _guarded
 from .utils import (
-    _coalesce,
+    _clean_str,
     _ensure_list_of_facets,
-    _ensure_list_of_floats,
-    _ensure_list_of_ints,
-    _ensure_list_of_strings,
+    _first,
+    _join_fields,
     _list_to_field_value,
     _parse_semantic_answers,
     _parse_semantic_captions,
-    _try_parse_float,
-    _try_parse_int,
     _vector_field_selector,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Keep-alive connections held per host; sized for concurrent SSE tool calls.
+# Seconds to wait for a TCP/TLS connection and for each response read.
+_CONNECTION_TIMEOUT = 5
+_READ_TIMEOUT = 30
+# azure-core's RetryPolicy already honours 429/503 and Retry-After; these tune it.
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF_FACTOR = 0.5
+
+# Largest page Azure AI Search returns before handing out a continuation token.
+_SERVICE_PAGE_SIZE = 1000
+# Rank constant for reciprocal rank fusion, matching the service's own hybrid ranking.
+_RRF_K = 60
+# Request options that need the service to see every query branch at once.
+_FANOUT_BLOCKERS = frozenset(
+    {
+        "include_total_count",
+        "skip",
+        "order_by",
+        "facets",
+        "query_caption",
+        "query_caption_highlight_enabled",
+        "query_answer",
+        "query_answer_count",
+        "query_answer_threshold",
+    }
+)
+# Lexical-only parameters, sent with the lexical branch of a fanned-out request.
+_LEXICAL_KEYS = ("search_text", "search_mode", "search_fields")
+
+
+def _prefetch_pages(results: Any) -> Iterator[Any]:
+    """Yield result rows while the next service page downloads in the background.
+
+    Pages are chained through continuation tokens, so only one request can be
+    in flight at a time; overlapping it with formatting the current page still
+    hides most of the round-trip for multi-page result sets.
+    """
+
+    pages = results.by_page()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(next, pages, None)
+        while True:
+            page = pending.result()
+            if page is None:
+                return
+            rows = list(page)
+            pending = executor.submit(next, pages, None)
+            yield from rows
+
+
+def _build_transport(pool_size: int) -> RequestsTransport:
+    """Create a keep-alive requests transport whose pool holds ``pool_size`` connections."""
+
+    session = requests.Session()
+    # Retries stay with the azure-core pipeline, matching the SDK's own adapter.
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, connection_timeout=_CONNECTION_TIMEOUT, read_timeout=_READ_TIMEOUT)
+
+
+@lru_cache(maxsize=1)
+def _shared_search_client(
+    endpoint: str,
+    index_name: str,
+    api_key: str,
+    pool_size: int,
+) -> Tuple[AzureKeyCredential, SearchClient]:
+    """Return the process-wide credential and SDK client for a service/index/key.
+
+    Sharing one SearchClient keeps a single HTTP pipeline, connection pool, and
+    credential for every AzureSearchClient built against the same index.
+    """
+
+    logger.info("Connecting to Azure AI Search at %s", endpoint)
+    credential = AzureKeyCredential(api_key)
+    search_client = SearchClient(
+        endpoint=endpoint,
+        index_name=index_name,
+        credential=credential,
+        transport=_build_transport(pool_size),
+        retry_total=_RETRY_TOTAL,
+        retry_backoff_factor=_RETRY_BACKOFF_FACTOR,
+    )
+    return credential, search_client
+
+
+@lru_cache(maxsize=1024)
+def _vector_query(
+    text: str,
+    fields: str,
+    k: Optional[int],
+    weight: Optional[float],
+    query_rewrites: Optional[str],
+) -> VectorizableTextQuery:
+    """Return a shared query model for a vector descriptor.
+
+    The SDK only serializes vector queries into the request body and never
+    mutates them, so identical descriptors can reuse one instance.
+    """
+
+    return VectorizableTextQuery(
+        text=text,
+        fields=fields,
+        k_nearest_neighbors=k,
+        weight=weight,
+        query_rewrites=query_rewrites,
+    )
+
+
+@lru_cache(maxsize=8)
+def _facets_reader(result_type: type) -> Optional[Callable[[Any], Any]]:
+    """Return the result type's `get_facets` method, or None when it has none; looked up once per type."""
+
+    return getattr(result_type, "get_facets", None)
+
+
+def _build_payload(
+    rows: Iterable[Tuple[Optional[str], Optional[str], Any, bool]],
+    report_applied: bool,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Split one parameter spec into SDK search kwargs and the applied-parameters echo.
+
+    Each row is ``(sdk_key, applied_key, value, echo)``. A row reaches the SDK
+    kwargs when it has an ``sdk_key`` and a non-None value. It reaches the echo
+    when it has an ``applied_key`` and ``echo`` is true. The echo is only built
+    (and otherwise None) when ``report_applied`` is set.
+    """
+
+    search_kwargs: Dict[str, Any] = {}
+    applied: Optional[Dict[str, Any]] = {} if report_applied else None
+    for sdk_key, applied_key, value, echo in rows:
+        if sdk_key is not None and value is not None:
+            search_kwargs[sdk_key] = value
+        if applied is not None and applied_key is not None and echo:
+            applied[applied_key] = value
+    return search_kwargs, applied
+
+
+def _freeze(value: Any) -> Any:
+    """Turn a search kwarg value into a hashable equivalent for cache keys."""
+
+    if isinstance(value, VectorizableTextQuery):
+        return (value.text, value.fields, value.k_nearest_neighbors, value.weight, value.query_rewrites)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _result_cache_key(search_kwargs: Dict[str, Any], *extras: Hashable) -> Tuple[Any, ...]:
+    """Order-independent key for a search request plus the options that shape its formatting."""
+
+    return tuple(sorted((key, _freeze(value)) for key, value in search_kwargs.items())) + extras
+
+
+def _fanout_branches(
+    search_kwargs: Dict[str, Any], key_field: Optional[str] = None
+) -> Optional[List[Tuple[Dict[str, Any], float]]]:
+    """Split a multi-vector request into one request per query branch, with its fusion weight.
+
+    Every branch asks for ``max(top, k)`` rows, the deepest ``k`` for the lexical branch,
+    so fusion ranks over the same candidates the service would; the fused list is cut
+    back to ``top``. ``key_field`` is added to a narrowed ``select`` so branch rows can be
+    matched by document key.
+
+    Returns None when the request has fewer than two vector queries or uses options
+    (semantic ranking, counts, paging, ordering, facets, captions, answers) that
+    cannot be reproduced by fusing branches on the client.
+    """
+
+    vector_queries = search_kwargs.get("vector_queries") or ()
+    if (
+        len(vector_queries) < 2
+        or search_kwargs.get("query_type") == "semantic"
+        or not _FANOUT_BLOCKERS.isdisjoint(search_kwargs)
+    ):
+        return None
+
+    shared = {
+        key: value for key, value in search_kwargs.items() if key not in _LEXICAL_KEYS and key != "vector_queries"
+    }
+    select = shared.get("select")
+    if key_field and select and key_field not in select.split(","):
+        shared["select"] = f"{select},{key_field}"
+    top = search_kwargs.get("top") or 0
+    depths = [max(top, query.k_nearest_neighbors or 0) for query in vector_queries]
+    branches = [
+        ({**shared, "vector_queries": [query], "top": depth}, _first(query.weight, 1.0))
+        for query, depth in zip(vector_queries, depths)
+    ]
+    if "search_text" in search_kwargs:
+        lexical = {key: search_kwargs[key] for key in _LEXICAL_KEYS if key in search_kwargs}
+        # The lexical branch carries no vector query, so the vector filter mode does not apply.
+        lexical_shared = {key: value for key, value in shared.items() if key != "vector_filter_mode"}
+        branches.append(({**lexical_shared, **lexical, "top": max(depths)}, 1.0))
+    return branches
+
+
+def _document_identity(row: Dict[str, Any], key_field: Optional[str] = None) -> Tuple[Any, ...]:
+    """Identify a document across branch results by its key, or its non-annotation fields without one."""
+
+    if key_field and row.get(key_field) is not None:
+        return (key_field, row[key_field])
+    return tuple(sorted((key, repr(value)) for key, value in row.items() if not key.startswith("@")))
+
+
+def _reciprocal_rank_fusion(
+    ranked_lists: Sequence[Sequence[Dict[str, Any]]],
+    weights: Sequence[float],
+    top: int,
+    key_field: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Merge ranked result lists with weighted RRF; the fused score replaces `@search.score`."""
+
+    fused: Dict[Tuple[Any, ...], List[Any]] = {}
+    for rows, weight in zip(ranked_lists, weights):
+        for rank, row in enumerate(rows, 1):
+            contribution = weight / (_RRF_K + rank)
+            entry = fused.get(identity := _document_identity(row, key_field))
+            if entry is None:
+                fused[identity] = [contribution, row]
+            else:
+                entry[0] += contribution
+
+    ordered = sorted(fused.values(), key=lambda entry: entry[0], reverse=True)[:top]
+    return [{**row, "@search.score": score} for score, row in ordered]
+
+
+# Fields surfaced when the caller does not pass `select`; "Chunk" is reported as "chunk".
+_DEFAULT_FIELDS = ("title", "Title", "name", "Name", "FullName", "fullName", "content", "chunk", "Chunk")
+_DEFAULT_FIELDS_SET = frozenset(_DEFAULT_FIELDS)
+
+
+def _caption_from(captions: Any, highlight_requested: bool) -> Optional[str]:
+    """Pick the first caption's highlighted or plain text, honoring the highlight preference."""
+
+    if not captions:
+        return None
+
+    first = captions[0]
+    # SDK models expose attributes; raw REST payloads are plain dicts.
+    if isinstance(first, dict):
+        highlight_text, caption_text = first.get("highlights"), first.get("text")
+    else:
+        highlight_text, caption_text = getattr(first, "highlights", None), getattr(first, "text", None)
+
+    # Only the text that is actually returned gets stripped.
+    if highlight_requested and highlight_text and (highlight_text := highlight_text.strip()):
+        return highlight_text
+    return (caption_text or "").strip() or None
+
+
+def _default_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the default fields in one pass over the document; "Chunk" is reported as "chunk"."""
+
+    entry: Dict[str, Any] = {}
+    for key, value in result.items():
+        if key not in _DEFAULT_FIELDS_SET or value in (None, ""):
+            continue
+        if key == "chunk":
+            if value:
+                entry["chunk"] = value
+        elif key == "Chunk":
+            if not entry.get("chunk"):
+                entry["chunk"] = value
+        else:
+            entry[key] = value
+    return entry
+
+
+@lru_cache(maxsize=64)
+def _row_formatter(
+    select_fields: Tuple[str, ...],
+    include_scores: bool,
+    caption_requested: bool,
+    highlight_requested: bool,
+    semantic: bool,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Return a row formatter specialized for one combination of formatting options.
+
+    The field extractor is chosen once here rather than per row, and the result
+    is cached, so a session that keeps its options reuses the same function.
+    Captions and reranker scores only exist under semantic ranking, so other
+    queries never probe for them.
+    """
+
+    read_captions = caption_requested and semantic
+    read_reranker_score = include_scores and semantic
+
+    if select_fields:
+
+        def _fields(result: Dict[str, Any]) -> Dict[str, Any]:
+            get = result.get
+            return {field: value for field in select_fields if (value := get(field)) not in (None, "")}
+
+    else:
+        _fields = _default_fields
+
+    def _format_entry(result: Dict[str, Any]) -> Dict[str, Any]:
+        entry = _fields(result)
+        get = result.get
+
+        if read_captions:
+            caption_value = _caption_from(get("@search.captions"), highlight_requested)
+            if caption_value:
+                entry["@search.caption"] = caption_value
+
+        if include_scores:
+            score = get("@search.score")
+            if score is not None:
+                entry["@search.score"] = score
+        if read_reranker_score:
+            # The SDK row carries "@search.reranker_score"; raw REST payloads use the wire name.
+            reranker_score = _first(get("@search.reranker_score"), get("@search.rerankerScore"))
+            if reranker_score is not None:
+                entry["@search.rerankerScore"] = reranker_score
+
+        return entry
+
+    return _format_entry
+
+
+def _fallback_entry(result: Dict[str, Any], document_keys: Tuple[str, ...], include_scores: bool) -> Dict[str, Any]:
+    """Show every non-empty document field of a row that produced nothing else."""
+
+    get = result.get
+    entry = {key: value for key in document_keys if (value := get(key)) not in (None, "")}
+    if include_scores and "@search.score" not in entry:
+        entry["@search.score"] = get("@search.score", 0)
+    return entry
+
+
 class AzureSearchClient:
     """Client for Azure AI Search service."""
 
+    _instance: ClassVar[Optional["AzureSearchClient"]] = None
+
+    @classmethod
+    def instance(cls) -> "AzureSearchClient":
+        """Return the shared client, rebuilding it only when the environment changed."""
+
+        cached = cls._instance
+        if cached is None or cached._defaults is not _load_defaults():
+            cached = cls._instance = cls()
+        return cached
+
     def __init__(self):
         """Initialize Azure Search client with credentials from environment variables."""
 
-        print("Initializing Azure Search client...", file=sys.stderr)
-        self.endpoint = os.getenv("AZURE_SEARCH_SERVICE_ENDPOINT")
-        self.index_name = os.getenv("AZURE_SEARCH_INDEX_NAME")
-        api_key = os.getenv("AZURE_SEARCH_API_KEY")
+        logger.info("Initializing Azure Search client...")
+        defaults: _ClientDefaults = _load_defaults()
+        self._defaults = defaults
+        self.endpoint = defaults.endpoint
+        self.index_name = defaults.index_name
+        api_key = defaults.api_key
 
         # Validate environment variables
         if not all([self.endpoint, self.index_name, api_key]):
@@ -46,63 +404,79 @@ class AzureSearchClient:
             if not api_key:
                 missing.append("AZURE_SEARCH_API_KEY")
             error_msg = f"Missing environment variables: {', '.join(missing)}"
-            print(f"Error: {error_msg}", file=sys.stderr)
+            logger.error(error_msg)
             raise ValueError(error_msg)
 
-        # Initialize the search client
-        print(f"Connecting to Azure AI Search at {self.endpoint}", file=sys.stderr)
-        self.credential = AzureKeyCredential(api_key)
-        self.search_client = SearchClient(
-            endpoint=self.endpoint,
-            index_name=self.index_name,
-            credential=self.credential,
-        )
-        print(f"Azure Search client initialized for index: {self.index_name}", file=sys.stderr)
-
-        # Optional defaults for hybrid search configuration
-        self.default_semantic_configuration = os.getenv("AZURE_SEARCH_SEMANTIC_CONFIGURATION")
-        self.default_search_fields = _ensure_list_of_strings(os.getenv("AZURE_SEARCH_SEARCH_FIELDS"))
-        self.default_vector_fields = _ensure_list_of_strings(os.getenv("AZURE_SEARCH_VECTOR_FIELDS"))
-        self.default_select_fields = _ensure_list_of_strings(os.getenv("AZURE_SEARCH_SELECT_FIELDS"))
-        self.default_query_type = os.getenv("AZURE_SEARCH_QUERY_TYPE")
-        self.default_search_mode = os.getenv("AZURE_SEARCH_SEARCH_MODE", "all")
-        self.default_query_language = os.getenv("AZURE_SEARCH_QUERY_LANGUAGE")
-        self.default_query_rewrites = os.getenv("AZURE_SEARCH_QUERY_REWRITES") or "generative|count-5"
-        self.default_debug = os.getenv("AZURE_SEARCH_DEBUG")
-        self.default_vector_k = _coalesce(
-            _try_parse_int(os.getenv("AZURE_SEARCH_VECTOR_DEFAULT_K")),
-            60,
+        # Reuse the SDK client (and its connection pool) for this service/index/key
+        self.credential, self.search_client = _shared_search_client(
+            self.endpoint, self.index_name, api_key, defaults.pool_maxsize
         )
-        self.default_vector_weight = _coalesce(
-            _try_parse_float(os.getenv("AZURE_SEARCH_VECTOR_DEFAULT_WEIGHT")),
-            1.0,
+        logger.info("Azure Search client initialized for index: %s", self.index_name)
+
+        # Optional defaults for hybrid search configuration (field lists are immutable tuples)
+        self.default_semantic_configuration = defaults.semantic_configuration
+        self.default_search_fields = defaults.search_fields
+        self.default_vector_fields = defaults.vector_fields
+        self._default_vector_field_selector = _vector_field_selector(self.default_vector_fields)
+        self.default_select_fields = defaults.select_fields
+        # SDK-ready forms of the defaults, reused whenever a request does not override them.
+        # Treat the search fields list as read-only; it is shared by every request.
+        self._default_search_fields_value = _list_to_field_value(self.default_search_fields)
+        self._default_select_value = _join_fields(self.default_select_fields)
+        self.default_query_type = defaults.query_type
+        self.default_search_mode = defaults.search_mode
+        self.default_query_language = defaults.query_language
+        self.default_query_rewrites = defaults.query_rewrites
+        self.default_debug = defaults.debug
+        self.default_vector_k = defaults.vector_k
+        self.default_vector_weight = defaults.vector_weight
+        self.fanout = defaults.fanout
+        self.key_field = defaults.key_field
+        self._throttle: Optional[_RequestGate] = _RequestGate(defaults.max_qps) if defaults.max_qps > 0 else None
+        # Formatted results of recent requests; a TTL or size of 0 disables caching.
+        self._result_cache: Optional[_TTLCache] = None
+        if defaults.result_cache_ttl > 0 and defaults.result_cache_size > 0:
+            self._result_cache = _TTLCache(defaults.result_cache_size, defaults.result_cache_ttl)
+        self._in_flight = _SingleFlight()
+        # Optional near-duplicate cache; None unless enabled, given a positive TTL (entries would
+        # expire at once, yet every request would pay for an embedding) and its dependencies load.
+        self._semantic_cache: Optional[_SemanticCache] = (
+            _create_semantic_cache(defaults.result_cache_ttl)
+            if defaults.semantic_cache and defaults.result_cache_ttl > 0
+            else None
         )
 
+    def warm_up(self) -> None:
+        """Send one minimal query so DNS, TLS and a pooled connection are ready before the first tool call.
+
+        Failures are only logged; the first real search reports any problem to the caller.
+        """
+
+        try:
+            with _guarded(self._throttle):
+                next(iter(self.search_client.search(search_text="*", top=1, select=self._default_select_value)), None)
+        except Exception as exc:
+            logger.debug("Search warm-up request failed: %s", exc)
+        else:
+            logger.debug("Search warm-up request completed")
+
     def keyword_search(self, query: str, top: int = 5):
         """Perform keyword search on the index."""
 
-        print(f"Performing keyword search for: {query}", file=sys.stderr)
-        results = self.search_client.search(
-            search_text=query,
-            top=top,
-        )
-        return self._format_results(results)
+        logger.debug("Performing keyword search for: %s", query)
+        with _guarded(self._throttle):
+            return list(self._format_results(self.search_client.search(search_text=query, top=top)))
 
     def vector_search(self, query: str, top: int = 5, vector_field: str = "text_vector"):
         """Perform vector search on the index."""
 
-        print(f"Performing vector search for: {query}", file=sys.stderr)
-        results = self.search_client.search(
-            vector_queries=[
-                VectorizableTextQuery(
-                    text=query,
-                    k_nearest_neighbors=50,
-                    fields=vector_field,
-                )
-            ],
-            top=top,
-        )
-        return self._format_results(results)
+        logger.debug("Performing vector search for: %s", query)
+        with _guarded(self._throttle):
+            results = self.search_client.search(
+                vector_queries=[_vector_query(query, vector_field, 50, None, None)],
+                top=top,
+            )
+            return list(self._format_results(results))
 
     def hybrid_search(
         self,
@@ -136,144 +510,180 @@ class AzureSearchClient:
     ) -> Dict[str, Any]:
         """Perform search with granular configuration support."""
 
-        print("Performing configurable search", file=sys.stderr)
+        logger.debug("Performing configurable search")
 
         lexical_query = (search_text or "").strip()
         has_lexical = bool(lexical_query)
 
-        normalized_vector_texts = [text.strip() for text in vector_texts if text and text.strip()]
+        normalized_vector_texts = [stripped for text in vector_texts if text and (stripped := text.strip())]
         has_vectors = bool(normalized_vector_texts)
 
         if not has_lexical and not has_vectors:
             raise ValueError("Provide either a non-empty `search` query, at least one vector descriptor, or both.")
 
-        effective_semantic_configuration = _coalesce(
-            semantic_configuration,
-            self.default_semantic_configuration,
-        )
+        effective_semantic_configuration = _first(semantic_configuration, self.default_semantic_configuration)
         if not effective_semantic_configuration:
             raise ValueError(
                 "Semantic configuration name is required. Provide it via the `semantic_configuration` "
                 "parameter or set `AZURE_SEARCH_SEMANTIC_CONFIGURATION`."
             )
 
-        effective_search_fields = list(search_fields) if search_fields else list(self.default_search_fields)
+        effective_search_fields = search_fields or self.default_search_fields
         if has_lexical and not effective_search_fields:
             raise ValueError(
                 "Search fields are required for lexical queries. Provide them via the `search_fields` parameter "
                 "or set `AZURE_SEARCH_SEARCH_FIELDS`."
             )
 
-        effective_vector_fields = list(vector_fields) if vector_fields else list(self.default_vector_fields)
-        if has_vectors and not effective_vector_fields:
-            effective_vector_fields = ["text_vector"]
-
-        effective_select_fields = list(select_fields) if select_fields else list(self.default_select_fields)
-
         effective_query_type = query_type or self.default_query_type
-        effective_query_language = query_language.strip() if isinstance(query_language, str) and query_language.strip() else self.default_query_language
-        effective_query_rewrites = query_rewrites.strip() if isinstance(query_rewrites, str) and query_rewrites.strip() else self.default_query_rewrites
-        effective_debug = debug.strip() if isinstance(debug, str) and debug.strip() else self.default_debug
+        effective_query_language = _clean_str(query_language) or self.default_query_language
+        effective_query_rewrites = _clean_str(query_rewrites) or self.default_query_rewrites
+        effective_debug = _clean_str(debug) or self.default_debug
 
-        effective_search_mode = (search_mode or self.default_search_mode or "all").lower()
+        # The env default is lowercased once when it is parsed.
+        effective_search_mode = search_mode.lower() if search_mode else self.default_search_mode
         if has_lexical and effective_search_mode not in {"any", "all"}:
             raise ValueError("`search_mode` must be either 'any' or 'all'.")
 
         if effective_query_type == "semantic" and effective_query_rewrites and effective_search_mode != "any":
             effective_search_mode = "any"
 
-        effective_vector_default_k = _coalesce(vector_default_k, self.default_vector_k, 60)
-        effective_vector_default_weight = _coalesce(vector_default_weight, self.default_vector_weight, 1.0)
+        # The env defaults already carry the 60 / 1.0 fallbacks (see config._parse_defaults).
+        effective_vector_default_k = vector_default_k if vector_default_k is not None else self.default_vector_k
+        effective_vector_default_weight = (
+            vector_default_weight if vector_default_weight is not None else self.default_vector_weight
+        )
+
+        report_applied = logger.isEnabledFor(logging.DEBUG)
 
         resolved_vector_ks: List[Optional[int]] = []
         resolved_vector_weights: List[Optional[float]] = []
-        if has_vectors:
-            vector_ks_list = list(vector_ks)
-            vector_weights_list = list(vector_weights)
-            for idx, _ in enumerate(normalized_vector_texts):
-                candidate_k: Optional[int] = None
-                if vector_ks_list:
-                    if idx < len(vector_ks_list):
-                        candidate_k = vector_ks_list[idx]
-                    else:
-                        candidate_k = vector_ks_list[-1]
-                resolved_vector_ks.append(candidate_k or effective_vector_default_k)
-
-                candidate_weight: Optional[float] = None
-                if vector_weights_list:
-                    if idx < len(vector_weights_list):
-                        candidate_weight = vector_weights_list[idx]
-                    else:
-                        candidate_weight = vector_weights_list[-1]
-                resolved_vector_weights.append(candidate_weight or effective_vector_default_weight)
-
         vector_queries = []
         vector_field_value: Optional[str] = None
         if has_vectors:
-            vector_field_value = _vector_field_selector(effective_vector_fields)
+            vector_field_value = (
+                _vector_field_selector(vector_fields) if vector_fields else self._default_vector_field_selector
+            )
+            # Indexable sequences (the tool always passes lists) are used without copying.
+            vector_ks_list = vector_ks if hasattr(vector_ks, "__len__") else list(vector_ks)
+            vector_weights_list = vector_weights if hasattr(vector_weights, "__len__") else list(vector_weights)
+            ks_count = len(vector_ks_list)
+            weights_count = len(vector_weights_list)
+            rewrites_count = len(vector_rewrites)
+            # Missing per-vector values repeat the last one supplied.
+            ks_last = vector_ks_list[-1] if vector_ks_list else None
+            weights_last = vector_weights_list[-1] if vector_weights_list else None
+            # Vectors that echo the lexical query inherit the semantic rewrites; the check is loop-invariant.
+            inherit_rewrites = (
+                effective_query_rewrites
+                if effective_query_type == "semantic" and effective_query_rewrites and has_lexical
+                else None
+            )
+            lexical_query_lower = lexical_query.lower() if inherit_rewrites else ""
+
+            # Exact repeats of a text with the same rewrites are vectorized once; their weights
+            # add up and the largest k wins. Any other difference keeps the queries apart.
+            specs: List[List[Any]] = []
+            spec_positions: Dict[Tuple[str, Optional[str]], int] = {}
             for idx, text in enumerate(normalized_vector_texts):
-                per_vector_rewrites = vector_rewrites[idx] if idx < len(vector_rewrites) else None
-                if (
-                    not per_vector_rewrites
-                    and effective_query_type == "semantic"
-                    and effective_query_rewrites
-                    and has_lexical
-                    and text.lower() == lexical_query.lower()
-                ):
-                    per_vector_rewrites = effective_query_rewrites
-                vector_queries.append(
-                    VectorizableTextQuery(
-                        text=text,
-                        fields=vector_field_value,
-                        k_nearest_neighbors=resolved_vector_ks[idx],
-                        weight=resolved_vector_weights[idx],
-                        query_rewrites=per_vector_rewrites,
-                    )
+                k = (vector_ks_list[idx] if idx < ks_count else ks_last) or effective_vector_default_k
+                weight = (
+                    vector_weights_list[idx] if idx < weights_count else weights_last
+                ) or effective_vector_default_weight
+                if report_applied:
+                    resolved_vector_ks.append(k)
+                    resolved_vector_weights.append(weight)
+
+                per_vector_rewrites = vector_rewrites[idx] if idx < rewrites_count else None
+                if not per_vector_rewrites and inherit_rewrites and text.lower() == lexical_query_lower:
+                    per_vector_rewrites = inherit_rewrites
+
+                position = spec_positions.setdefault((text, per_vector_rewrites), len(specs))
+                if position == len(specs):
+                    specs.append([text, k, weight, per_vector_rewrites])
+                else:
+                    spec = specs[position]
+                    spec[1] = max(spec[1], k)
+                    spec[2] += weight
+
+            vector_queries = [
+                _vector_query(text, vector_field_value, k, weight, rewrites) for text, k, weight, rewrites in specs
+            ]
+            if len(vector_queries) < len(normalized_vector_texts):
+                logger.debug(
+                    "Collapsed %d vector texts into %d vector queries", len(normalized_vector_texts), len(vector_queries)
                 )
 
-        facet_values = _ensure_list_of_facets(facets)
-
-        search_kwargs: Dict[str, Any] = {
-            "top": top,
-            "semantic_configuration_name": effective_semantic_configuration,
-        }
+        facet_values = _ensure_list_of_facets(facets) if facets else ()
 
+        search_fields_value: Optional[List[str]] = None
         if has_lexical:
-            search_kwargs["search_text"] = lexical_query
-            search_kwargs["search_mode"] = effective_search_mode
-
-        if has_vectors:
-            search_kwargs["vector_queries"] = vector_queries
-
-        if count:
-            search_kwargs["include_total_count"] = True
-
-        if skip:
-            search_kwargs["skip"] = skip
-
-        search_fields_value = _list_to_field_value(effective_search_fields) if has_lexical else None
-        if search_fields_value:
-            search_kwargs["search_fields"] = search_fields_value
-
-        select_value = _list_to_field_value(effective_select_fields)
-        if select_value:
-            search_kwargs["select"] = select_value
-
-        if effective_query_type:
-            search_kwargs["query_type"] = effective_query_type
+            search_fields_value = (
+                _list_to_field_value(search_fields) if search_fields else self._default_search_fields_value
+            )
+        # The SDK passes a str `select` through as-is, so the joined value is cached per field tuple.
+        select_value = _join_fields(tuple(select_fields)) if select_fields else self._default_select_value
+        # Rows are formatted from the same cleaned fields that the request and its cache key carry.
+        effective_select_fields = tuple(select_value.split(",")) if select_value else ()
 
         if effective_query_type == "semantic":
             if not effective_query_language:
                 raise ValueError(
                     "Query language is required for semantic queries. Provide `query_language` or set `AZURE_SEARCH_QUERY_LANGUAGE`."
                 )
-            search_kwargs["query_language"] = effective_query_language
-            search_kwargs["query_rewrites"] = effective_query_rewrites
+            request_query_language = effective_query_language
+            request_query_rewrites = effective_query_rewrites
         else:
-            if query_language:
-                search_kwargs["query_language"] = query_language
-            if query_rewrites:
-                search_kwargs["query_rewrites"] = query_rewrites
+            request_query_language = query_language or None
+            request_query_rewrites = query_rewrites or None
+
+        # One spec drives both the SDK kwargs and the DEBUG-only applied-parameters echo.
+        # Rows are (sdk_key, applied_key, value, echo); see _build_payload.
+        search_kwargs, applied_payload = _build_payload(
+            (
+                ("search_text", None, lexical_query if has_lexical else None, False),
+                ("search_mode", "search_mode", effective_search_mode if has_lexical else None, has_lexical),
+                ("vector_queries", None, vector_queries if has_vectors else None, False),
+                ("top", "top", top, True),
+                ("skip", "skip", skip or None, bool(skip)),
+                ("include_total_count", None, True if count else None, False),
+                (None, "count", count, True),
+                ("semantic_configuration_name", "semantic_configuration", effective_semantic_configuration, True),
+                ("search_fields", "search_fields", search_fields_value, has_lexical),
+                ("select", "select", select_value, bool(select_value)),
+                ("query_type", None, effective_query_type or None, False),
+                (None, "query_type", effective_query_type, has_lexical),
+                (
+                    "query_language",
+                    "query_language",
+                    request_query_language,
+                    has_lexical and bool(request_query_language),
+                ),
+                ("query_rewrites", None, request_query_rewrites, False),
+                (
+                    None,
+                    "query_rewrites",
+                    query_rewrites or request_query_rewrites,
+                    has_lexical and (effective_query_type == "semantic" or bool(query_rewrites)),
+                ),
+                ("filter", None, filter_expression or None, False),
+                ("order_by", None, list(order_by) if order_by else None, False),
+                ("facets", "facets", facet_values or None, bool(facet_values)),
+                ("vector_filter_mode", "vector_filter_mode", vector_filter_mode or None, bool(vector_filter_mode)),
+                ("debug", "debug", effective_debug or None, bool(effective_debug)),
+                (None, "captions", captions, True),
+                (None, "answers", answers, True),
+                (None, "include_scores", include_scores, True),
+                (None, "vector_fields", vector_field_value, has_vectors),
+                (None, "vector_default_k", effective_vector_default_k, has_vectors),
+                (None, "vector_default_weight", effective_vector_default_weight, has_vectors),
+                (None, "vector_ks", resolved_vector_ks, has_vectors),
+                (None, "vector_weights", resolved_vector_weights, has_vectors),
+            ),
+            report_applied,
+        )
+        if applied_payload is not None:
+            logger.debug("Applied search parameters: %r", applied_payload)
 
         caption_preferences = {"requested": False, "highlight": False}
         if captions:
@@ -284,85 +694,134 @@ class AzureSearchClient:
         if answers:
             search_kwargs.update(_parse_semantic_answers(answers))
 
-        if filter_expression:
-            search_kwargs["filter"] = filter_expression
-
-        if order_by:
-            search_kwargs["order_by"] = list(order_by)
-
-        if facet_values:
-            search_kwargs["facets"] = facet_values
-
-        if vector_filter_mode:
-            search_kwargs["vector_filter_mode"] = vector_filter_mode
-
-        if effective_debug:
-            search_kwargs["debug"] = effective_debug
-
-        print(f"Search payload: {search_kwargs}", file=sys.stderr)
-
-        results_page = self.search_client.search(**search_kwargs)
-
-        total_count = results_page.get_count() if count else None
-        formatted_results = self._format_results(
-            results_page,
-            select_fields=effective_select_fields,
-            include_scores=include_scores,
-            caption_preferences=caption_preferences,
-        )
-
-        applied_payload: Dict[str, Any] = {
-            "top": top,
-            "semantic_configuration": effective_semantic_configuration,
-            "count": count,
-            "captions": captions,
-            "answers": answers,
-            "include_scores": include_scores,
-        }
-        if has_lexical:
-            applied_payload["search_mode"] = effective_search_mode
-            applied_payload["search_fields"] = search_fields_value
-            applied_payload["query_type"] = effective_query_type
-            if effective_query_type == "semantic":
-                applied_payload["query_language"] = effective_query_language
-                applied_payload["query_rewrites"] = effective_query_rewrites
-            elif query_language:
-                applied_payload["query_language"] = query_language
-            if query_rewrites:
-                applied_payload["query_rewrites"] = query_rewrites
-        if select_value:
-            applied_payload["select"] = select_value
-        if has_vectors:
-            applied_payload.update(
+        if report_applied:
+            # Vector query reprs embed every text and rewrite; log their count instead.
+            logger.debug(
+                "Search payload: %r",
                 {
-                    "vector_fields": vector_field_value,
-                    "vector_default_k": effective_vector_default_k,
-                    "vector_default_weight": effective_vector_default_weight,
-                    "vector_ks": resolved_vector_ks,
-                    "vector_weights": resolved_vector_weights,
-                }
+                    key: f"<{len(value)} vector queries>" if key == "vector_queries" else value
+                    for key, value in search_kwargs.items()
+                },
             )
-        if facet_values:
-            applied_payload["facets"] = facet_values
-        if vector_filter_mode:
-            applied_payload["vector_filter_mode"] = vector_filter_mode
-        if skip:
-            applied_payload["skip"] = skip
-        if effective_debug:
-            applied_payload["debug"] = effective_debug
 
-        try:
-            facets_result = results_page.get_facets()  # type: ignore[attr-defined]
-        except AttributeError:
-            facets_result = None
+        # Total counts and semantic answers are expected to be fresh, so those requests always go out.
+        cacheable = not count and not answers
+        format_options = (include_scores, caption_preferences["requested"], caption_preferences["highlight"])
+
+        cache_key = None
+        if self._result_cache is not None and cacheable:
+            cache_key = _result_cache_key(search_kwargs, *format_options)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Result cache hit")
+                return {**cached, "applied": applied_payload}
+
+        semantic_vector = semantic_scope = None
+        if self._semantic_cache is not None and cacheable:
+            # Everything except the query texts must match exactly for a near-duplicate hit.
+            semantic_scope = _result_cache_key(
+                {key: value for key, value in search_kwargs.items() if key not in ("search_text", "vector_queries")},
+                tuple(
+                    (query.fields, query.k_nearest_neighbors, query.weight, query.query_rewrites)
+                    for query in vector_queries
+                ),
+                *format_options,
+            )
+            # The cache is an optimization: an embedding backend failure must not fail the search.
+            try:
+                semantic_vector = self._semantic_cache.embed("\n".join([lexical_query, *normalized_vector_texts]))
+                cached = self._semantic_cache.get(semantic_vector, semantic_scope)
+            except Exception as exc:
+                logger.warning("Semantic cache lookup failed; searching without it: %s", exc)
+                semantic_vector = cached = None
+            if cached is not None:
+                logger.debug("Semantic cache hit")
+                return {**cached, "applied": applied_payload}
+
+        def _search_and_store() -> Dict[str, Any]:
+            response = self._execute_search(
+                search_kwargs,
+                top=top,
+                count=count,
+                select_fields=effective_select_fields,
+                include_scores=include_scores,
+                caption_preferences=caption_preferences,
+                semantic=effective_query_type == "semantic",
+            )
+            # Cached responses are shared between callers and must not be mutated.
+            if cache_key is not None:
+                self._result_cache.put(cache_key, response)
+            if semantic_vector is not None:
+                try:
+                    self._semantic_cache.put(semantic_vector, semantic_scope, response)
+                except Exception as exc:
+                    logger.warning("Semantic cache store failed: %s", exc)
+            return response
+
+        # Identical cacheable requests that arrive while one is in flight wait for its response.
+        response = self._in_flight.run(cache_key, _search_and_store) if cache_key is not None else _search_and_store()
+        return {**response, "applied": applied_payload}
+
+    def _execute_search(
+        self,
+        search_kwargs: Dict[str, Any],
+        *,
+        top: int,
+        count: bool,
+        select_fields: Sequence[str],
+        include_scores: bool,
+        caption_preferences: Dict[str, bool],
+        semantic: bool,
+    ) -> Dict[str, Any]:
+        """Send the request (or its fan-out branches) and format the response."""
+
+        branches = _fanout_branches(search_kwargs, self.key_field) if self.fanout else None
+        # Results page in lazily, so the guard spans every service call this request makes.
+        with _guarded(self._throttle, len(branches) if branches else 1):
+            if branches:
+                results_page = None
+                total_count = None
+                rows = self._fused_search(branches, top)
+            else:
+                results_page = self.search_client.search(**search_kwargs)
+                total_count = results_page.get_count() if count else None
+                rows = results_page
+                if top > _SERVICE_PAGE_SIZE and hasattr(results_page, "by_page"):
+                    rows = _prefetch_pages(results_page)
+
+            # The MCP response is serialized as a whole, so the stream is materialized here, once.
+            formatted_results = list(
+                self._format_results(
+                    rows,
+                    select_fields=select_fields,
+                    include_scores=include_scores,
+                    caption_preferences=caption_preferences,
+                    semantic=semantic,
+                )
+            )
+
+            get_facets = _facets_reader(type(results_page))
+            facets_result = get_facets(results_page) if get_facets is not None else None
 
         return {
             "items": formatted_results,
             "count": total_count,
             "facets": facets_result,
-            "applied": applied_payload,
         }
 
+    def _fused_search(self, branches: List[Tuple[Dict[str, Any], float]], top: int) -> List[Dict[str, Any]]:
+        """Run each query branch concurrently and fuse the ranked results."""
+
+        logger.debug("Fanning out %d query branches", len(branches))
+
+        def _run(search_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return list(self.search_client.search(**search_kwargs))
+
+        with ThreadPoolExecutor(max_workers=len(branches)) as executor:
+            ranked_lists = list(executor.map(_run, (search_kwargs for search_kwargs, _ in branches)))
+
+        return _reciprocal_rank_fusion(ranked_lists, [weight for _, weight in branches], top, self.key_field)
+
     def _format_results(
         self,
         results,
@@ -370,81 +829,37 @@ class AzureSearchClient:
         select_fields: Optional[Sequence[str]] = None,
         include_scores: bool = True,
         caption_preferences: Optional[dict[str, bool]] = None,
-    ) -> List[Dict[str, Any]]:
-        """Format search results honoring selected fields and caption preferences."""
-
-        formatted_results: List[Dict[str, Any]] = []
-
-        select_list = list(select_fields or [])
-        caption_requested = bool(caption_preferences and caption_preferences.get("requested"))
-        highlight_requested = bool(caption_preferences and caption_preferences.get("highlight"))
-
-        default_field_order = ["title", "Title", "name", "Name", "FullName", "fullName"]
-
-        for result in results:
-            entry: Dict[str, Any] = {}
-
-            if select_list:
-                for field in select_list:
-                    value = result.get(field)
-                    if value not in (None, ""):
-                        entry[field] = value
-            else:
-                for field in default_field_order:
-                    value = result.get(field)
-                    if value not in (None, "") and field not in entry:
-                        entry[field] = value
-
-                content_value = result.get("content")
-                if content_value not in (None, ""):
-                    entry["content"] = content_value
-
-                chunk_value = result.get("chunk") or result.get("Chunk")
-                if chunk_value not in (None, ""):
-                    entry["chunk"] = chunk_value
-
-            if caption_requested:
-                captions = result.get("@search.captions") or []
-                caption_value: Optional[str] = None
-                if captions:
-                    first = captions[0]
-                    if hasattr(first, "highlights") or hasattr(first, "text"):
-                        highlight_text = (getattr(first, "highlights", "") or "").strip()
-                        caption_text = (getattr(first, "text", "") or "").strip()
-                    else:
-                        highlight_text = (first.get("highlights") or "").strip()
-                        caption_text = (first.get("text") or "").strip()
-                    if highlight_requested and highlight_text:
-                        caption_value = highlight_text
-                    elif highlight_requested and not highlight_text and caption_text:
-                        caption_value = caption_text
-                    elif not highlight_requested and caption_text:
-                        caption_value = caption_text
-                if caption_value:
-                    entry["@search.caption"] = caption_value
-
-            if include_scores:
-                score = result.get("@search.score")
-                if score is not None:
-                    entry["@search.score"] = score
-                reranker_score = result.get("@search.rerankerScore")
-                if reranker_score is not None:
-                    entry["@search.rerankerScore"] = reranker_score
+        semantic: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield search results formatted with selected fields and caption preferences.
+
+        Entries are produced as the SDK pages in documents, so callers that only
+        iterate never hold the formatted copy of a whole result set.
+        """
+
+        format_entry = _row_formatter(
+            tuple(select_fields or ()),
+            include_scores,
+            bool(caption_preferences and caption_preferences.get("requested")),
+            bool(caption_preferences and caption_preferences.get("highlight")),
+            semantic,
+        )
 
+        # SDK rows of one response share a key set, so the document keys for the
+        # fallback are collected once and only recollected when a row differs.
+        row_keys: FrozenSet[str] = frozenset()
+        document_keys: Tuple[str, ...] = ()
+        formatted_count = 0
+        for formatted_count, result in enumerate(results, 1):
+            entry = format_entry(result)
             if not entry:
-                # Ensure there is at least something to show
-                for key, value in result.items():
-                    if key.startswith("@"):
-                        continue
-                    if value not in (None, ""):
-                        entry[key] = value
-                if include_scores and "@search.score" not in entry:
-                    entry["@search.score"] = result.get("@search.score", 0)
-
-            formatted_results.append(entry)
-
-        print(f"Formatted {len(formatted_results)} search results", file=sys.stderr)
-        return formatted_results
+                if result.keys() != row_keys:
+                    row_keys = frozenset(result)
+                    document_keys = tuple(key for key in result if not key.startswith("@"))
+                entry = _fallback_entry(result, document_keys, include_scores)
+            yield entry
+
+        logger.debug("Formatted %d search results", formatted_count)
 
 
 __all__ = ["AzureSearchClient"]
@@ -0,0 +1,151 @@
+"""Environment-derived configuration for the Azure Search client."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from .utils import _ensure_list_of_strings, _first, _try_parse_float, _try_parse_int
+
+
+_ENV_KEYS: Tuple[str, ...] = (
+    "AZURE_SEARCH_SERVICE_ENDPOINT",
+    "AZURE_SEARCH_INDEX_NAME",
+    "AZURE_SEARCH_API_KEY",
+    "AZURE_SEARCH_SEMANTIC_CONFIGURATION",
+    "AZURE_SEARCH_SEARCH_FIELDS",
+    "AZURE_SEARCH_VECTOR_FIELDS",
+    "AZURE_SEARCH_SELECT_FIELDS",
+    "AZURE_SEARCH_QUERY_TYPE",
+    "AZURE_SEARCH_SEARCH_MODE",
+    "AZURE_SEARCH_QUERY_LANGUAGE",
+    "AZURE_SEARCH_QUERY_REWRITES",
+    "AZURE_SEARCH_DEBUG",
+    "AZURE_SEARCH_VECTOR_DEFAULT_K",
+    "AZURE_SEARCH_VECTOR_DEFAULT_WEIGHT",
+    "AZURE_SEARCH_RESULT_CACHE_TTL",
+    "AZURE_SEARCH_RESULT_CACHE_SIZE",
+    "AZURE_SEARCH_SEMANTIC_CACHE",
+    "AZURE_SEARCH_FANOUT",
+    "AZURE_SEARCH_KEY_FIELD",
+    "AZURE_SEARCH_POOL_MAXSIZE",
+    "AZURE_SEARCH_MAX_QPS",
+    "AZURE_SEARCH_PREWARM",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ClientDefaults:
+    """Parsed, immutable view of the Azure Search environment configuration."""
+
+    endpoint: Optional[str]
+    index_name: Optional[str]
+    api_key: Optional[str]
+    semantic_configuration: Optional[str]
+    search_fields: Tuple[str, ...]
+    vector_fields: Tuple[str, ...]
+    select_fields: Tuple[str, ...]
+    query_type: Optional[str]
+    search_mode: str
+    query_language: Optional[str]
+    query_rewrites: str
+    debug: Optional[str]
+    vector_k: int
+    vector_weight: float
+    result_cache_ttl: float
+    result_cache_size: int
+    semantic_cache: bool
+    fanout: bool
+    key_field: str
+    pool_maxsize: int
+    max_qps: float
+    prewarm: bool
+
+
+def _snapshot_env() -> Tuple[Optional[str], ...]:
+    """Return the raw values of every environment variable the client reads."""
+
+    environ = os.environ
+    return tuple(environ.get(name) for name in _ENV_KEYS)
+
+
+def _env_list(raw: Optional[str]) -> Tuple[str, ...]:
+    """Split a comma/newline separated env value; unset or empty values skip parsing."""
+
+    return tuple(_ensure_list_of_strings(raw)) if raw else ()
+
+
+def _env_flag(raw: Optional[str]) -> bool:
+    """Interpret an on/off env value; only 1/true/yes (any case) switch a feature on."""
+
+    return (raw or "").strip().lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=8)
+def _parse_defaults(raw: Tuple[Optional[str], ...]) -> _ClientDefaults:
+    """Parse a raw environment snapshot; cached so unchanged env is parsed once."""
+
+    (
+        endpoint,
+        index_name,
+        api_key,
+        semantic_configuration,
+        search_fields,
+        vector_fields,
+        select_fields,
+        query_type,
+        search_mode,
+        query_language,
+        query_rewrites,
+        debug,
+        vector_k,
+        vector_weight,
+        result_cache_ttl,
+        result_cache_size,
+        semantic_cache,
+        fanout,
+        key_field,
+        pool_maxsize,
+        max_qps,
+        prewarm,
+    ) = raw
+
+    return _ClientDefaults(
+        endpoint=endpoint,
+        index_name=index_name,
+        api_key=api_key,
+        semantic_configuration=semantic_configuration,
+        search_fields=_env_list(search_fields),
+        vector_fields=_env_list(vector_fields),
+        select_fields=_env_list(select_fields),
+        query_type=query_type,
+        search_mode=(search_mode or "all").lower(),
+        query_language=query_language,
+        query_rewrites=query_rewrites or "generative|count-5",
+        debug=debug,
+        vector_k=_first(_try_parse_int(vector_k), 60),
+        vector_weight=_first(_try_parse_float(vector_weight), 1.0),
+        result_cache_ttl=_first(_try_parse_float(result_cache_ttl), 60.0),
+        result_cache_size=_first(_try_parse_int(result_cache_size), 256),
+        semantic_cache=_env_flag(semantic_cache),
+        fanout=_env_flag(fanout),
+        key_field=key_field or "id",
+        pool_maxsize=_first(_try_parse_int(pool_maxsize), 32),
+        max_qps=_first(_try_parse_float(max_qps), 30.0),
+        prewarm=_env_flag(prewarm or "1"),
+    )
+
+
+def _load_defaults() -> _ClientDefaults:
+    """Return client defaults for the current environment.
+
+    Reading the environment is a handful of dict lookups; the list splitting
+    and numeric parsing behind it only runs when a value actually changes.
+    """
+
+    return _parse_defaults(_snapshot_env())
+
+
+__all__ = ["_ClientDefaults", "_load_defaults"]
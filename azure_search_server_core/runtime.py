@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import sys
+import threading
 from typing import Optional, Tuple
 
 from dotenv import load_dotenv  # type: ignore[import]
@@ -12,26 +14,55 @@ from mcp.server.fastmcp import FastMCP  # type: ignore[import]
 from .client import AzureSearchClient
 
 
+logger = logging.getLogger(__name__)
+
+_PACKAGE_LOGGER = "azure_search_server_core"
+
+
+def configure_logging() -> None:
+    """Send package logs to stderr at the level named by ``LOG_LEVEL`` (default INFO).
+
+    Logging goes to stderr so it never interferes with the stdio transport.
+    """
+
+    level = getattr(logging, (os.getenv("LOG_LEVEL") or "INFO").strip().upper(), None)
+    if not isinstance(level, int):
+        level = logging.INFO
+
+    package_logger = logging.getLogger(_PACKAGE_LOGGER)
+    package_logger.setLevel(level)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        package_logger.addHandler(handler)
+        # FastMCP configures the root logger too; avoid printing every line twice.
+        package_logger.propagate = False
+
+
 def initialize_runtime() -> Tuple[FastMCP, Optional[AzureSearchClient]]:
     """Load environment variables, create the MCP instance, and initialize the client."""
 
-    print("Starting Azure AI Search MCP Server...", file=sys.stderr)
     load_dotenv()
-    print("Environment variables loaded", file=sys.stderr)
+    configure_logging()
+    logger.info("Starting Azure AI Search MCP Server...")
+    logger.info("Environment variables loaded")
 
     mcp = FastMCP(
         "azure-search",
         description="MCP server for Azure AI Search integration",
         dependencies=["azure-search-documents==11.6.0b10", "azure-identity", "python-dotenv"],
     )
-    print("MCP server instance created", file=sys.stderr)
+    logger.info("MCP server instance created")
 
     try:
-        print("Starting initialization of search client...", file=sys.stderr)
-        search_client = AzureSearchClient()
-        print("Search client initialized successfully", file=sys.stderr)
+        logger.info("Starting initialization of search client...")
+        search_client = AzureSearchClient.instance()
+        logger.info("Search client initialized successfully")
+        if search_client._defaults.prewarm:
+            # Pay for DNS, TLS and the first connection off the first tool call's critical path.
+            threading.Thread(target=search_client.warm_up, name="azure-search-warm-up", daemon=True).start()
     except Exception as exc:  # pragma: no cover - diagnostic path
-        print(f"Error initializing search client: {exc}", file=sys.stderr)
+        logger.error("Error initializing search client: %s", exc)
         search_client = None
 
     return mcp, search_client
@@ -40,7 +71,7 @@ def initialize_runtime() -> Tuple[FastMCP, Optional[AzureSearchClient]]:
 def run_server(mcp: FastMCP) -> None:
     """Run the MCP server using either SSE or stdio transport."""
 
-    print("Starting MCP server run...", file=sys.stderr)
+    logger.info("Starting MCP server run...")
     transport = os.getenv("MCP_TRANSPORT", "sse")
     if transport == "sse":
         host = os.getenv("MCP_HOST", "0.0.0.0")
@@ -49,24 +80,21 @@ def run_server(mcp: FastMCP) -> None:
             mcp.settings.host = host
             mcp.settings.port = port
         except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"Warning: failed to set host/port on settings: {exc}", file=sys.stderr)
-        print(f"Running MCP server over SSE on {host}:{port}", file=sys.stderr)
+            logger.warning("failed to set host/port on settings: %s", exc)
+        logger.info("Running MCP server over SSE on %s:%s", host, port)
         try:
             mcp.run(transport="sse")
         except TypeError as exc:
             message = str(exc)
             if "missing" in message and "argument" in message:
-                print(
-                    "FastMCP.run requires explicit host/port; retrying with legacy signature",
-                    file=sys.stderr,
-                )
+                logger.info("FastMCP.run requires explicit host/port; retrying with legacy signature")
                 mcp.run(transport="sse", host=host, port=port)  # type: ignore[call-arg]
             else:
                 raise
     else:
-        print("Running MCP server over stdio", file=sys.stderr)
+        logger.info("Running MCP server over stdio")
         mcp.run()
 
 
-__all__ = ["initialize_runtime", "run_server"]
+__all__ = ["configure_logging", "initialize_runtime", "run_server"]
 
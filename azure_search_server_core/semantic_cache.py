@@ -0,0 +1,136 @@
+"""Opt-in cache that answers near-duplicate searches by query-embedding similarity.
+
+Enabled with ``AZURE_SEARCH_SEMANTIC_CACHE=1``. Embeddings come from Azure OpenAI when
+``AZURE_OPENAI_ENDPOINT``, ``AZURE_OPENAI_API_KEY`` and ``AZURE_OPENAI_EMBEDDING_DEPLOYMENT``
+are set, otherwise from a local sentence-transformers model. numpy and the embedding
+backend are imported lazily, so none of them is needed while the cache is off.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Hashable, List, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_AZURE_OPENAI_API_VERSION = "2024-02-01"
+
+
+def _load_embedder() -> Optional[Callable[[str], Sequence[float]]]:
+    """Return a text embedding function, or None when no backend is available."""
+
+    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+    api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    deployment = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT")
+    if endpoint and api_key and deployment:
+        try:
+            from openai import AzureOpenAI  # type: ignore[import]
+        except ImportError:
+            logger.warning("openai is not installed; cannot use Azure OpenAI embeddings for the semantic cache")
+        else:
+            client = AzureOpenAI(
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                api_version=os.getenv("AZURE_OPENAI_API_VERSION") or _AZURE_OPENAI_API_VERSION,
+            )
+            return lambda text: client.embeddings.create(model=deployment, input=text).data[0].embedding
+
+    try:
+        from sentence_transformers import SentenceTransformer  # type: ignore[import]
+    except ImportError:
+        logger.warning("No embedding backend available; semantic cache disabled")
+        return None
+
+    model = SentenceTransformer(_LOCAL_MODEL)
+    return model.encode
+
+
+class _SemanticCache:
+    """Fixed-size ring buffer of query embeddings and the responses they produced.
+
+    Embeddings are kept L2-normalized in one contiguous float32 matrix, so a lookup
+    is a single matrix-vector product. A hit needs cosine similarity of at least
+    ``threshold`` and an identical ``scope``: every request parameter other than
+    the query texts. Entries expire ``ttl`` seconds after they were stored.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        *,
+        capacity: int = 512,
+        threshold: float = 0.92,
+        ttl: float = 60.0,
+    ):
+        import numpy  # type: ignore[import]
+
+        self._np = numpy
+        self._embed = embed
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self._matrix: Any = None
+        self._scopes: List[Optional[Hashable]] = [None] * capacity
+        self._values: List[Any] = [None] * capacity
+        self._expires: List[float] = [0.0] * capacity
+        self._next = 0
+        self._filled = 0
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> Any:
+        """Return the normalized embedding for ``text``."""
+
+        vector = self._np.asarray(self._embed(text), dtype=self._np.float32)
+        norm = float(self._np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def get(self, vector: Any, scope: Hashable) -> Optional[Any]:
+        """Return the best cached response within ``scope`` similar enough to ``vector``."""
+
+        now = time.monotonic()
+        with self._lock:
+            if not self._filled:
+                return None
+            scores = self._matrix[: self._filled] @ vector
+            candidates = self._np.flatnonzero(scores >= self.threshold)
+            for index in candidates[self._np.argsort(-scores[candidates])]:
+                if self._scopes[index] == scope and self._expires[index] > now:
+                    return self._values[index]
+        return None
+
+    def put(self, vector: Any, scope: Hashable, value: Any) -> None:
+        """Store ``value``, overwriting the oldest slot once the buffer is full."""
+
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = self._np.zeros((self.capacity, vector.shape[0]), dtype=self._np.float32)
+            slot = self._next
+            self._matrix[slot] = vector
+            self._scopes[slot] = scope
+            self._values[slot] = value
+            self._expires[slot] = time.monotonic() + self.ttl
+            self._next = (slot + 1) % self.capacity
+            self._filled = min(self._filled + 1, self.capacity)
+
+
+def _create_semantic_cache(ttl: float) -> Optional[_SemanticCache]:
+    """Build the semantic cache, or return None when numpy or an embedding backend is missing."""
+
+    try:
+        import numpy  # type: ignore[import]  # noqa: F401
+    except ImportError:
+        logger.warning("numpy is not installed; semantic cache disabled")
+        return None
+
+    embed = _load_embedder()
+    if embed is None:
+        return None
+    return _SemanticCache(embed, ttl=ttl)
+
+
+__all__ = ["_SemanticCache", "_create_semantic_cache"]
@@ -0,0 +1,107 @@
+"""Client-side rate limiting and a throttling circuit breaker for Azure Search calls."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from azure.core.exceptions import HttpResponseError  # type: ignore[import]
+
+
+logger = logging.getLogger(__name__)
+
+# Longest a request may queue for a token before it is rejected locally.
+_MAX_WAIT_SECONDS = 2.0
+# Breaker duration when a 429 response carries no usable Retry-After header.
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+class _ThrottledError(RuntimeError):
+    """Raised instead of calling the service while throttled or over the local rate."""
+
+
+def _retry_after(response: Any) -> float:
+    """Seconds requested by a 429 response's Retry-After header (numeric form only)."""
+
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(float(headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER
+
+
+class _RequestGate:
+    """Token bucket capping requests per second, plus a breaker opened by HTTP 429.
+
+    The bucket holds one second of burst, and never less than one request. A request
+    asking for more tokens than the bucket holds (a fan-out) starts once the bucket is
+    full and borrows the rest from later requests. A request that would have to wait
+    longer than ``_MAX_WAIT_SECONDS`` is rejected instead of queued. After
+    the service answers 429 (once the SDK's own retries are exhausted), every request
+    fails fast until the Retry-After interval has passed.
+    """
+
+    def __init__(self, max_qps: float):
+        self.max_qps = max_qps
+        self._capacity = max(max_qps, 1.0)
+        self._tokens = self._capacity
+        self._stamp = time.monotonic()
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Take ``tokens`` from the bucket, sleeping briefly if the bucket is short."""
+
+        with self._lock:
+            now = time.monotonic()
+            if now < self._open_until:
+                raise _ThrottledError(
+                    f"Azure AI Search is throttling requests; retry in {self._open_until - now:.1f}s."
+                )
+            self._tokens = min(self._capacity, self._tokens + (now - self._stamp) * self.max_qps)
+            self._stamp = now
+            needed = min(tokens, self._capacity)
+            wait = (needed - self._tokens) / self.max_qps if self._tokens < needed else 0.0
+            if wait > _MAX_WAIT_SECONDS:
+                logger.warning("Rejecting search: local rate limit of %s requests/s exceeded", self.max_qps)
+                raise _ThrottledError("Too many concurrent searches; retry shortly.")
+            self._tokens -= tokens
+
+        if wait:
+            time.sleep(wait)
+
+    def trip(self, seconds: float) -> None:
+        """Reject requests for the next ``seconds``."""
+
+        with self._lock:
+            self._open_until = max(self._open_until, time.monotonic() + seconds)
+        logger.warning("Azure AI Search throttled the server (HTTP 429); pausing requests for %.1fs", seconds)
+
+    @contextmanager
+    def guard(self, tokens: int = 1) -> Iterator[None]:
+        """Acquire ``tokens`` and open the breaker if the guarded calls end in HTTP 429."""
+
+        self.acquire(tokens)
+        try:
+            yield
+        except HttpResponseError as exc:
+            if exc.status_code == 429:
+                self.trip(_retry_after(exc.response))
+            raise
+
+
+@contextmanager
+def _guarded(gate: Optional[_RequestGate], tokens: int = 1) -> Iterator[None]:
+    """`_RequestGate.guard` that is a no-op when rate limiting is disabled."""
+
+    if gate is None:
+        yield
+        return
+    with gate.guard(tokens):
+        yield
+
+
+__all__ = ["_RequestGate", "_ThrottledError", "_guarded"]
@@ -3,48 +3,78 @@
 from __future__ import annotations
 
 import argparse
-import json
+import contextlib
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
+
+# pydantic-core ships with the MCP SDK; its native JSON codec is much faster than
+# the stdlib one on large result sets.
+from pydantic_core import from_json, to_json  # type: ignore[import]
+
+
+def _parse_payload(raw_payload: bytes, where: str = "") -> Dict[str, Any]:
+    """Parse one JSON payload object; ``where`` locates it in error messages."""
+
+    try:
+        payload = from_json(raw_payload)
+    except ValueError as exc:  # pragma: no cover - CLI parsing
+        raise SystemExit(f"Failed to parse JSON payload{where}: {exc}") from exc
+
+    if not isinstance(payload, dict):
+        raise SystemExit(f"Payload{where} must be a JSON object.")
+
+    return payload
 
 
 def _load_payload(payload_path: Path | None) -> Dict[str, Any]:
     """Load search payload from a file or stdin."""
 
-    raw_payload: str | None = None
-
+    # Raw bytes go straight to the parser, skipping a text decode of the whole payload.
     if payload_path is not None:
-        raw_payload = payload_path.read_text(encoding="utf-8")
+        raw_payload = payload_path.read_bytes()
     elif not sys.stdin.isatty():
-        raw_payload = sys.stdin.read()
+        raw_payload = sys.stdin.buffer.read()
+    else:
+        raw_payload = b""
 
-    if raw_payload in (None, ""):
+    if not raw_payload:
         raise SystemExit("Provide a JSON payload via --payload or stdin.")
 
-    try:
-        payload = json.loads(raw_payload)
-    except json.JSONDecodeError as exc:  # pragma: no cover - CLI parsing
-        raise SystemExit(f"Failed to parse JSON payload: {exc}") from exc
+    return _parse_payload(raw_payload)
 
-    if not isinstance(payload, dict):
-        raise SystemExit("Payload must be a JSON object.")
 
-    return payload
+def _iter_payloads(payload_path: Path | None) -> Iterator[Dict[str, Any]]:
+    """Yield JSON-lines payloads from a file or stdin one line at a time, skipping blank lines."""
+
+    if payload_path is None and sys.stdin.isatty():
+        raise SystemExit("Provide JSON-lines payloads via --payload or stdin.")
+
+    with (payload_path.open("rb") if payload_path is not None else contextlib.nullcontext(sys.stdin.buffer)) as stream:
+        for number, line in enumerate(stream, 1):
+            if line.strip():
+                yield _parse_payload(line, f" on line {number}")
 
 
 def _dump_result(result: Dict[str, Any], pretty: bool) -> None:
-    """Print the search result to stdout."""
+    """Print the search result to stdout as UTF-8 JSON; non-ASCII text is not ``\\u``-escaped."""
 
-    if pretty:
-        json.dump(result, sys.stdout, indent=2, ensure_ascii=True)
-    else:
-        json.dump(result, sys.stdout, ensure_ascii=True)
-    sys.stdout.write("\n")
+    data = to_json(result, indent=2 if pretty else None) + b"\n"
+    # Written as bytes so non-ASCII text never depends on the console encoding;
+    # text-only replacements for stdout (StringIO, captured output) get str.
+    stdout = getattr(sys.stdout, "buffer", None)
+    if stdout is None:
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
+        return
+    stdout.write(data)
+    stdout.flush()
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Run the query runner CLI."""
+@lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; `main` may be called repeatedly in one process."""
 
     parser = argparse.ArgumentParser(
         description=(
@@ -55,29 +85,44 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument(
         "--payload",
         type=Path,
-        help="Path to a JSON file containing the search payload. If omitted, stdin is used.",
+        help="Path to a JSON file containing the search payload (or payloads, with --jsonl). If omitted, stdin is used.",
     )
     parser.add_argument(
         "--pretty",
         action="store_true",
         help="Pretty-print the JSON response.",
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help=(
+            "Treat the input as JSON lines, one payload per line, and write one compact "
+            "result line per payload. --pretty is ignored."
+        ),
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the query runner CLI."""
 
-    args = parser.parse_args(argv)
+    args = _parser().parse_args(argv)
 
-    payload = _load_payload(args.payload)
+    payloads = _iter_payloads(args.payload) if args.jsonl else [_load_payload(args.payload)]
 
     try:
         from azure_search_server import search  # noqa: WPS433 - runtime import for env setup
     except Exception as exc:  # pragma: no cover - defensive import handling
         raise SystemExit(f"Failed to initialize search tool: {exc}") from exc
 
-    try:
-        result = search(**payload)
-    except TypeError as exc:
-        raise SystemExit(f"Payload keys do not match search tool signature: {exc}") from exc
+    # One import, client and connection pool serve every payload.
+    for payload in payloads:
+        try:
+            result = search(**payload)
+        except TypeError as exc:
+            raise SystemExit(f"Payload keys do not match search tool signature: {exc}") from exc
 
-    _dump_result(result, args.pretty)
+        _dump_result(result, args.pretty and not args.jsonl)
     return 0
 
 
@@ -2,334 +2,459 @@
 
 from __future__ import annotations
 
-import sys
-from typing import Annotated, Any, Callable, Dict, List, Optional, Union
+import functools
+import inspect
+import logging
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Optional, Union
 
-from pydantic import Field  # type: ignore[import]
+import anyio  # type: ignore[import]
+import anyio.to_thread  # type: ignore[import]
+from azure.core.exceptions import AzureError  # type: ignore[import]
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata  # type: ignore[import]
+from pydantic import Field, ValidationError  # type: ignore[import]
 
 from ..formatting import format_results
+from ..throttle import _ThrottledError
 from ..utils import (
+    _clean_str,
     _ensure_list_of_facets,
     _ensure_list_of_strings,
     _normalize_vector_descriptors,
 )
 
 
-def register_search_tool(mcp, get_search_client) -> Callable:
-    """Register the unified search tool on the provided MCP instance."""
+logger = logging.getLogger(__name__)
+
+# Tool parameter types are built once at import so registration only reads them.
+_SearchArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Lexical search expression. Supports the Azure Search simple syntax including phrase "
+            "matching, logical operators, required (+), negation, and exact phrases. Leave empty when "
+            "performing vector-only search. Should be alligned with either Simple Query Parser,"
+            "Full Lucene Query Parser or be a Semantic Query depending on the query type."
+            "Simple Query Parser Rules:"
+            "A phrase search is an exact phrase enclosed in quotation marks \" \"."
+            "Boolean operators are: + (AND), - (NOT), | (OR)."
+            "Starts with: lingui* will match on linguistic or linguini"
+            "Full Lucene Query Parser Rules:"
+            "Boolean operators are: AND, OR, NOT."
+            "You can define a fielded search operation with the fieldName:searchExpression"
+            "To do a fuzzy search, use the tilde ~ symbol at the end of a single word with an optional "
+            "parameter, a number between 0 and 2 (default), that specifies the edit distance. For example,"
+            "blue~ or blue~1 would return blue, blues, and glue."
+            "Proximity searches are used to find terms that are near each other in a document. Insert a "
+            "tilde ~ symbol at the end of a phrase followed by the number of words that create the proximity"
+            "boundary. For example, \"hotel airport\"~5 finds the terms hotel and airport within five words of"
+            "each other in a document."
+            "rock^2 electronic boosts documents that contain the search terms in the genre field higher than"
+            "other searchable fields in the index."
+            "A regular expression search finds a match based on patterns that are valid under Apache Lucene"
+            "In Azure AI Search, a regular expression is: Enclosed between forward slashes / and lower-case only."
+            "You can use generally recognized syntax for multiple (*) or single (?) character wildcard searches. "
+            "Full Lucene syntax supports prefix and infix matching."
+            "Semantic Query Rules:"
+            "Natural language queries"
+            
+        ),
+        examples=[
+            'motel+(wifi|luxury)',
+            'artists:("Miles Davis" "John Coltrane")',
+            '/[mh]otel/',
+            'hotelAmenities:(gym+(wifi|pool))',
+            '"firmware developer" AND ("c++" OR "embedded") NOT "leadership"',
+            'C firmware developer with 10 years of experience',
+
 
-    @mcp.tool()
-    def search(
-        search: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Lexical search expression. Supports the Azure Search simple syntax including phrase "
-                    "matching, logical operators, required (+), negation, and exact phrases. Leave empty when "
-                    "performing vector-only search. Should be alligned with either Simple Query Parser,"
-                    "Full Lucene Query Parser or be a Semantic Query depending on the query type."
-                    "Simple Query Parser Rules:"
-                    "A phrase search is an exact phrase enclosed in quotation marks \" \"."
-                    "Boolean operators are: + (AND), - (NOT), | (OR)."
-                    "Starts with: lingui* will match on linguistic or linguini"
-                    "Full Lucene Query Parser Rules:"
-                    "Boolean operators are: AND, OR, NOT."
-                    "You can define a fielded search operation with the fieldName:searchExpression"
-                    "To do a fuzzy search, use the tilde ~ symbol at the end of a single word with an optional "
-                    "parameter, a number between 0 and 2 (default), that specifies the edit distance. For example,"
-                    "blue~ or blue~1 would return blue, blues, and glue."
-                    "Proximity searches are used to find terms that are near each other in a document. Insert a "
-                    "tilde ~ symbol at the end of a phrase followed by the number of words that create the proximity"
-                    "boundary. For example, \"hotel airport\"~5 finds the terms hotel and airport within five words of"
-                    "each other in a document."
-                    "rock^2 electronic boosts documents that contain the search terms in the genre field higher than"
-                    "other searchable fields in the index."
-                    "A regular expression search finds a match based on patterns that are valid under Apache Lucene"
-                    "In Azure AI Search, a regular expression is: Enclosed between forward slashes / and lower-case only."
-                    "You can use generally recognized syntax for multiple (*) or single (?) character wildcard searches. "
-                    "Full Lucene syntax supports prefix and infix matching."
-                    "Semantic Query Rules:"
-                    "Natural language queries"
-                    
-                ),
-                examples=[
-                    'motel+(wifi|luxury)',
-                    'artists:("Miles Davis" "John Coltrane")',
-                    '/[mh]otel/',
-                    'hotelAmenities:(gym+(wifi|pool))',
-                    '"firmware developer" AND ("c++" OR "embedded") NOT "leadership"',
-                    'C firmware developer with 10 years of experience',
-
-
-                ],
-            ),
         ],
-        vectors: Annotated[
-            Optional[
-                Union[
-                    str,
-                    List[Union[str, List[Union[str, int, float, str]]]],
-                ]
-            ],
-            Field(
-                default=None,
-                description=(
-                    "Vector descriptors. Provide each vector as either a plain string (text only) or a list "
-                    "containing `[text, optional k, optional weight, optional query_rewrites]`. Strings can also be "
-                    "supplied one per line."
-                ),
-                examples=[
-                    [
-                        ["C or C++ software engineer...", 60, 2.0, "generative|count-3"],
-                        ["Embedded systems and hardware...", None, 1.3],
-                        "Programista C/C++ ...",
-                    ]
-                ],
-            ),
-        ] = None,
-        select: Annotated[
-            Optional[Union[str, List[str]]],
-            Field(
-                default=None,
-                description=(
-                    "Fields to include in the response. Accepts a comma-separated string or list"
-                ),
-            ),
-        ] = None,
-        query_type: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Azure `queryType` option. Use `simple` for standard lexical queries or `semantic` for "
-                    "semantic re-ranking."
-                ),
-                examples=["semantic", "simple", "full"],
-            ),
-        ] = None,
-        query_language: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Query language (for semantic queries). Provide an IETF language tag such as `en-US`. Required when "
-                    "`query_type` is `semantic` unless `AZURE_SEARCH_QUERY_LANGUAGE` is set."
-                ),
-                examples=["en-US", "pl-PL"],
-            ),
-        ] = None,
-        query_rewrites: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Override for semantic query rewrites (e.g. `generative|count-5`). Defaults to `AZURE_SEARCH_QUERY_REWRITES` "
-                    "or `generative|count-5`."
-                ),
-                examples=["generative|count-5"],
-            ),
-        ] = None,
-        semantic_configuration: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Semantic configuration to use. Required unless `AZURE_SEARCH_SEMANTIC_CONFIGURATION` is set "
-                    "in the environment."
-                ),
-            ),
-        ] = None,
-        captions: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Captions behavior, for example `extractive|highlight-true`. Leave empty to disable extractive "
-                    "captions. Captions only work with semantic queries."
-                ),
-            ),
-        ] = None,
-        answers: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Answers behavior, for example `extractive|count-10`. Leave empty to disable answer generation."
-                ),
-            ),
-        ] = None,
-        filter: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Optional OData filter expression, e.g. `DomainUserLogin eq 'aaszteborski' or parent_id eq '...'`."
-                ),
-            ),
-        ] = None,
-        order_by: Annotated[
-            Optional[Union[str, List[str]]],
-            Field(
-                default=None,
-                description=(
-                    "Optional order-by clause(s). Provide a comma-separated string or list, e.g. `@search.score desc`."
-                ),
-            ),
-        ] = None,
-        facets: Annotated[
-            Optional[Union[str, List[str]]],
-            Field(
-                default=None,
-                description=(
-                    "Optional facets to request. Provide comma-separated names or a list of facet expressions using Azure AI Search syntax, e.g. `field,count:20` with optional `sort:count` (descending by frequency) or `sort:value` (ascending by value)."
-                ),
-                examples=[
-                    "DomainUserLogin",
-                    "DomainUserLogin,count:10",
-                    "DomainUserLogin,count:10,sort:count",
-                    "DomainUserLogin,count:10,sort:value",
-                ],
-            ),
-        ] = None,
-        vector_filter_mode: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Optional vector filter mode. Use `preFilter` to apply filters during HNSW traversal (higher recall, higher latency), "
-                    "`postFilter` to filter per shard after traversal (faster but can miss highly selective matches), or "
-                    "`strictPostFilter` (preview) to filter after global aggregation (highest risk of false negatives with selective filters)."
-                ),
-                examples=["preFilter", "postFilter", "strictPostFilter"],
-            ),
-        ] = None,
-        skip: Annotated[
-            Optional[int],
-            Field(
-                default=None,
-                ge=0,
-                description="Number of results to skip from the start of the result set (server-side pagination).",
-            ),
-        ] = None,
-        debug: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description="Optional debug option, for example `queryRewrites`."
-            ),
-        ] = None,
-        search_mode: Annotated[
-            Optional[str],
-            Field(
-                default=None,
-                description=(
-                    "Lexical match strategy: `all` requires every term, `any` matches on any term. Defaults to "
-                    "`AZURE_SEARCH_SEARCH_MODE` or `all`."
-                ),
-                examples=["all", "any"],
-            ),
-        ] = None,
-        search_fields: Annotated[
-            Optional[Union[str, List[str]]],
-            Field(
-                default=None,
-                description=(
-                    "Fields to target with the lexical `search` parameter. Provide comma-separated names or a list. "
-                    "Required unless `AZURE_SEARCH_SEARCH_FIELDS` is set."
-                ),
-            ),
-        ] = None,
-        vector_fields: Annotated[
-            Optional[Union[str, List[str]]],
-            Field(
-                default=None,
-                description=(
-                    "Vector field names to evaluate for semantic similarity. Provide comma-separated names or a list. "
-                    "Defaults to `AZURE_SEARCH_VECTOR_FIELDS` or `text_vector`."
-                ),
-            ),
-        ] = None,
-        vector_default_k: Annotated[
-            Optional[int],
-            Field(
-                default=None,
-                ge=1,
-                description=(
-                    "Fallback `k` used when per-vector values are omitted. Defaults to `AZURE_SEARCH_VECTOR_DEFAULT_K` "
-                    "or 60."
-                ),
-            ),
-        ] = None,
-        vector_default_weight: Annotated[
-            Optional[float],
-            Field(
-                default=None,
-                gt=0,
-                description=(
-                    "Fallback vector weight used when per-vector values are omitted. Defaults to "
-                    "`AZURE_SEARCH_VECTOR_DEFAULT_WEIGHT` or 1.0."
-                ),
-            ),
-        ] = None,
-        top: Annotated[
-            int,
-            Field(
-                default=20,
-                ge=1,
-                le=2000,
-                description="Maximum number of results to return. Defaults to 20.",
-            ),
-        ] = 20,
-        count: Annotated[
-            bool,
-            Field(
-                default=False,
-                description="Whether to request the total number of matches (`includeTotalCount`). Adds latency.",
-            ),
-        ] = False,
-        include_scores: Annotated[
-            bool,
-            Field(
-                default=False,
-                description="Include `@search.score` (and reranker score when available) in the response.",
-            ),
-        ] = False,
-    ) -> Dict[str, Any]:
-        """Run a search (lexical, vector, or hybrid) based on provided parameters."""
+    ),
+]
+
+_VectorsArg = Annotated[
+    Optional[
+        Union[
+            str,
+            List[Union[str, List[Union[str, int, float, str]]]],
+        ]
+    ],
+    Field(
+        default=None,
+        description=(
+            "Vector descriptors. Provide each vector as either a plain string (text only) or a list "
+            "containing `[text, optional k, optional weight, optional query_rewrites]`. Strings can also be "
+            "supplied one per line."
+        ),
+        examples=[
+            [
+                ["C or C++ software engineer...", 60, 2.0, "generative|count-3"],
+                ["Embedded systems and hardware...", None, 1.3],
+                "Programista C/C++ ...",
+            ]
+        ],
+    ),
+]
+
+_SelectArg = Annotated[
+    Optional[Union[str, List[str]]],
+    Field(
+        default=None,
+        description=(
+            "Fields to include in the response. Accepts a comma-separated string or list"
+        ),
+    ),
+]
+
+_QueryTypeArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Azure `queryType` option. Use `simple` for standard lexical queries or `semantic` for "
+            "semantic re-ranking."
+        ),
+        examples=["semantic", "simple", "full"],
+    ),
+]
+
+_QueryLanguageArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Query language (for semantic queries). Provide an IETF language tag such as `en-US`. Required when "
+            "`query_type` is `semantic` unless `AZURE_SEARCH_QUERY_LANGUAGE` is set."
+        ),
+        examples=["en-US", "pl-PL"],
+    ),
+]
+
+_QueryRewritesArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Override for semantic query rewrites (e.g. `generative|count-5`). Defaults to `AZURE_SEARCH_QUERY_REWRITES` "
+            "or `generative|count-5`."
+        ),
+        examples=["generative|count-5"],
+    ),
+]
+
+_SemanticConfigurationArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Semantic configuration to use. Required unless `AZURE_SEARCH_SEMANTIC_CONFIGURATION` is set "
+            "in the environment."
+        ),
+    ),
+]
+
+_CaptionsArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Captions behavior, for example `extractive|highlight-true`. Leave empty to disable extractive "
+            "captions. Captions only work with semantic queries."
+        ),
+    ),
+]
+
+_AnswersArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Answers behavior, for example `extractive|count-10`. Leave empty to disable answer generation."
+        ),
+    ),
+]
+
+_FilterArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Optional OData filter expression, e.g. `DomainUserLogin eq 'aaszteborski' or parent_id eq '...'`."
+        ),
+    ),
+]
+
+_OrderByArg = Annotated[
+    Optional[Union[str, List[str]]],
+    Field(
+        default=None,
+        description=(
+            "Optional order-by clause(s). Provide a comma-separated string or list, e.g. `@search.score desc`."
+        ),
+    ),
+]
+
+_FacetsArg = Annotated[
+    Optional[Union[str, List[str]]],
+    Field(
+        default=None,
+        description=(
+            "Optional facets to request. Provide comma-separated names or a list of facet expressions using Azure AI Search syntax, e.g. `field,count:20` with optional `sort:count` (descending by frequency) or `sort:value` (ascending by value)."
+        ),
+        examples=[
+            "DomainUserLogin",
+            "DomainUserLogin,count:10",
+            "DomainUserLogin,count:10,sort:count",
+            "DomainUserLogin,count:10,sort:value",
+        ],
+    ),
+]
+
+_VectorFilterModeArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Optional vector filter mode. Use `preFilter` to apply filters during HNSW traversal (higher recall, higher latency), "
+            "`postFilter` to filter per shard after traversal (faster but can miss highly selective matches), or "
+            "`strictPostFilter` (preview) to filter after global aggregation (highest risk of false negatives with selective filters)."
+        ),
+        examples=["preFilter", "postFilter", "strictPostFilter"],
+    ),
+]
 
-        print("Tool called: search with structured parameters", file=sys.stderr)
+_SkipArg = Annotated[
+    Optional[int],
+    Field(
+        default=None,
+        ge=0,
+        description="Number of results to skip from the start of the result set (server-side pagination).",
+    ),
+]
+
+_DebugArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description="Optional debug option, for example `queryRewrites`."
+    ),
+]
+
+_SearchModeArg = Annotated[
+    Optional[str],
+    Field(
+        default=None,
+        description=(
+            "Lexical match strategy: `all` requires every term, `any` matches on any term. Defaults to "
+            "`AZURE_SEARCH_SEARCH_MODE` or `all`."
+        ),
+        examples=["all", "any"],
+    ),
+]
+
+_SearchFieldsArg = Annotated[
+    Optional[Union[str, List[str]]],
+    Field(
+        default=None,
+        description=(
+            "Fields to target with the lexical `search` parameter. Provide comma-separated names or a list. "
+            "Required unless `AZURE_SEARCH_SEARCH_FIELDS` is set."
+        ),
+    ),
+]
+
+_VectorFieldsArg = Annotated[
+    Optional[Union[str, List[str]]],
+    Field(
+        default=None,
+        description=(
+            "Vector field names to evaluate for semantic similarity. Provide comma-separated names or a list. "
+            "Defaults to `AZURE_SEARCH_VECTOR_FIELDS` or `text_vector`."
+        ),
+    ),
+]
+
+_VectorDefaultKArg = Annotated[
+    Optional[int],
+    Field(
+        default=None,
+        ge=1,
+        description=(
+            "Fallback `k` used when per-vector values are omitted. Defaults to `AZURE_SEARCH_VECTOR_DEFAULT_K` "
+            "or 60."
+        ),
+    ),
+]
+
+_VectorDefaultWeightArg = Annotated[
+    Optional[float],
+    Field(
+        default=None,
+        gt=0,
+        description=(
+            "Fallback vector weight used when per-vector values are omitted. Defaults to "
+            "`AZURE_SEARCH_VECTOR_DEFAULT_WEIGHT` or 1.0."
+        ),
+    ),
+]
+
+_TopArg = Annotated[
+    int,
+    Field(
+        default=20,
+        ge=1,
+        le=2000,
+        description="Maximum number of results to return. Defaults to 20.",
+    ),
+]
+
+_CountArg = Annotated[
+    bool,
+    Field(
+        default=False,
+        description="Whether to request the total number of matches (`includeTotalCount`). Adds latency.",
+    ),
+]
+
+_IncludeScoresArg = Annotated[
+    bool,
+    Field(
+        default=False,
+        description="Include `@search.score` (and reranker score when available) in the response.",
+    ),
+]
+
+_QueriesArg = Annotated[
+    List[Dict[str, Any]],
+    Field(
+        min_length=1,
+        description=(
+            "Searches to run concurrently. Each entry takes the same parameters as the `search` tool; "
+            "results are returned in the same order."
+        ),
+    ),
+]
+
+# Upper bound on searches from one batch that are in flight at once.
+_MULTI_SEARCH_CONCURRENCY = 8
+
+_CLIENT_NOT_INITIALIZED = "Azure Search client is not initialized. Check server logs for details."
+
+
+def _guarded_tool(search_type: str, get_search_client: Callable[[], Any]) -> Callable:
+    """Wrap a tool body with the shared client check, result formatting, and error handling.
+
+    The wrapped function returns the raw client payload; validation problems are
+    raised as ``ValueError`` and reported verbatim, anything else is logged and
+    reported as a failed search. Calls whose arguments do not match the tool
+    signature raise ``TypeError``. Service and throttling errors are expected under
+    load, so they are logged as one line; only unexpected failures log a traceback.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Dict[str, Any]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            logger.debug("Tool called: %s", fn.__name__)
+            # Arguments that do not fit the tool are the caller's mistake, not a failed
+            # search: let that TypeError propagate instead of reporting it below.
+            signature.bind(*args, **kwargs)
+
+            if get_search_client() is None:
+                return {"error": _CLIENT_NOT_INITIALIZED, "searchType": search_type}
+
+            try:
+                return format_results(fn(*args, **kwargs), search_type)
+            except ValueError as exc:
+                error_msg = str(exc)
+            except (AzureError, _ThrottledError) as exc:
+                logger.warning("%s failed (status %s): %s", search_type, getattr(exc, "status_code", None), exc)
+                error_msg = f"Error performing {search_type.lower()}: {exc}"
+            except Exception as exc:
+                logger.exception("%s failed", search_type)
+                error_msg = f"Error performing {search_type.lower()}: {exc}"
 
-        search_client = get_search_client()
-        if search_client is None:
             return {
-                "error": "Azure Search client is not initialized. Check server logs for details.",
-                "searchType": "Search",
+                "error": error_msg,
+                "searchType": search_type,
             }
 
-        vector_descriptors = _normalize_vector_descriptors(vectors)
-        lexical_query = (search or "").strip()
-        query_language = query_language.strip() if isinstance(query_language, str) else None
-        query_rewrites = query_rewrites.strip() if isinstance(query_rewrites, str) else None
-        debug = debug.strip() if isinstance(debug, str) else None
+        return wrapper
+
+    return decorator
+
+
+def _in_worker_thread(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Expose a blocking tool to MCP as a coroutine that runs it on a worker thread.
+
+    FastMCP calls synchronous tools directly on the event loop, so one slow
+    Azure Search round-trip would stall every other request on the session.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs))
+
+    return wrapper
+
+
+def register_search_tool(mcp, get_search_client) -> Callable:
+    """Register the unified search tool on the provided MCP instance.
 
+    The returned callable is the synchronous tool body, for direct (non-MCP) use.
+    """
+
+    @_guarded_tool("Search", get_search_client)
+    def search(
+        search: _SearchArg,
+        vectors: _VectorsArg = None,
+        select: _SelectArg = None,
+        query_type: _QueryTypeArg = None,
+        query_language: _QueryLanguageArg = None,
+        query_rewrites: _QueryRewritesArg = None,
+        semantic_configuration: _SemanticConfigurationArg = None,
+        captions: _CaptionsArg = None,
+        answers: _AnswersArg = None,
+        filter: _FilterArg = None,
+        order_by: _OrderByArg = None,
+        facets: _FacetsArg = None,
+        vector_filter_mode: _VectorFilterModeArg = None,
+        skip: _SkipArg = None,
+        debug: _DebugArg = None,
+        search_mode: _SearchModeArg = None,
+        search_fields: _SearchFieldsArg = None,
+        vector_fields: _VectorFieldsArg = None,
+        vector_default_k: _VectorDefaultKArg = None,
+        vector_default_weight: _VectorDefaultWeightArg = None,
+        top: _TopArg = 20,
+        count: _CountArg = False,
+        include_scores: _IncludeScoresArg = False,
+    ) -> Dict[str, Any]:
+        """Run a search (lexical, vector, or hybrid) based on provided parameters."""
+
+        lexical_query = (search or "").strip()
+        # Reject empty calls before any descriptor parsing; `vectors` may still turn out blank.
+        vector_descriptors = _normalize_vector_descriptors(vectors) if vectors else []
         if not lexical_query and not vector_descriptors:
-            return {
-                "error": "Provide either a lexical `search` query, at least one vector descriptor, or both.",
-                "searchType": "Search",
-            }
+            raise ValueError("Provide either a lexical `search` query, at least one vector descriptor, or both.")
+
+        query_language = _clean_str(query_language)
+        query_rewrites = _clean_str(query_rewrites)
+        debug = _clean_str(debug)
+
+        # One transposing pass over the (text, k, weight, rewrites) descriptors.
+        vector_text_list, vector_k_list, vector_weight_list, vector_rewrites_list = (
+            map(list, zip(*vector_descriptors)) if vector_descriptors else ([], [], [], [])
+        )
+        # Omitted list options (the usual case) skip normalization; the client treats None as unset.
+        search_fields_list = _ensure_list_of_strings(search_fields) if search_fields else None
+        select_fields_list = _ensure_list_of_strings(select) if select else None
+        vector_fields_list = _ensure_list_of_strings(vector_fields) if vector_fields else None
+        order_by_list = _ensure_list_of_strings(order_by) if order_by else None
+        facet_list = _ensure_list_of_facets(facets) if facets else None
 
-        vector_text_list = [item[0] for item in vector_descriptors]
-        vector_k_list = [item[1] for item in vector_descriptors]
-        vector_weight_list = [item[2] for item in vector_descriptors]
-        vector_rewrites_list = [item[3] for item in vector_descriptors]
-        search_fields_list = _ensure_list_of_strings(search_fields)
-        select_fields_list = _ensure_list_of_strings(select)
-        vector_fields_list = _ensure_list_of_strings(vector_fields)
-        order_by_list = _ensure_list_of_strings(order_by)
-        facet_list = _ensure_list_of_facets(facets)
-
-        payload = search_client.hybrid_search(
+        return get_search_client().hybrid_search(
             search_text=lexical_query,
             vector_texts=vector_text_list,
             top=top,
@@ -358,17 +483,65 @@ def register_search_tool(mcp, get_search_client) -> Callable:
             debug=debug,
         )
 
+    mcp.tool()(_in_worker_thread(search))
+    return search
+
+
+def _payload_error(exc: ValidationError) -> str:
+    """One-line summary of why a `multi_search` entry was rejected."""
+
+    problems = "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'payload'}: {error['msg']}" for error in exc.errors()
+    )
+    return f"Invalid search arguments: {problems}"
+
+
+def register_multi_search_tool(mcp, search: Callable[..., Dict[str, Any]]) -> Callable:
+    """Register a tool that runs several `search` payloads in one call.
+
+    ``search`` is the synchronous callable returned by `register_search_tool`.
+    Each payload is validated against the argument model FastMCP builds for the
+    `search` tool, so bounds and type coercion match a single search call; an
+    entry that fails validation, or names unknown parameters, gets its own
+    error result and the other entries still run.
+    """
+
+    metadata = func_metadata(search)
+    arg_model = metadata.arg_model
+    known_args = frozenset(arg_model.model_fields)
+
+    def _validated(payload: Dict[str, Any]) -> Dict[str, Any]:
+        unknown = sorted(set(payload) - known_args)
+        if unknown:
+            raise ValueError(f"Unknown search arguments: {', '.join(unknown)}")
         try:
-            return format_results(payload, "Search")
-        except Exception as exc:  # pragma: no cover - defensive diagnostics
-            error_msg = f"Error performing search: {exc}"
-            print(error_msg, file=sys.stderr)
-            return {
-                "error": error_msg,
-                "searchType": "Search",
-            }
+            return arg_model.model_validate(metadata.pre_parse_json(payload)).model_dump_one_level()
+        except ValidationError as exc:
+            raise ValueError(_payload_error(exc)) from None
 
-    return search
+    @mcp.tool()
+    async def multi_search(queries: _QueriesArg) -> Dict[str, Any]:
+        """Run several searches concurrently and return their results in request order."""
+
+        logger.debug("Tool called: multi_search (%d queries)", len(queries))
+        limiter = anyio.CapacityLimiter(_MULTI_SEARCH_CONCURRENCY)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        async def _run_at(index: int, payload: Dict[str, Any]) -> None:
+            try:
+                arguments = _validated(payload)
+            except ValueError as exc:
+                results[index] = {"error": str(exc), "searchType": "Search"}
+                return
+            results[index] = await anyio.to_thread.run_sync(functools.partial(search, **arguments), limiter=limiter)
+
+        async with anyio.create_task_group() as task_group:
+            for index, payload in enumerate(queries):
+                task_group.start_soon(_run_at, index, payload)
+
+        return {"searchType": "MultiSearch", "results": results}
+
+    return multi_search
 
 
-__all__ = ["register_search_tool"]
+__all__ = ["register_multi_search_tool", "register_search_tool"]
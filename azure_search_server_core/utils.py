@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import json
+import logging
 import re
-import sys
-from typing import Any, Optional, Sequence, Union, Callable, List, Iterable
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple, Union, Callable, List, Iterable
+
+
+logger = logging.getLogger(__name__)
+
+# Newlines and commas are interchangeable list separators.
+_SPLIT_TRANS = str.maketrans({"\n": ","})
+
+# Plain decimal literals, which float() always accepts; matched before falling back to try/except.
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
 
 
 def _coalesce(*values: Optional[Any]) -> Optional[Any]:
@@ -17,6 +27,22 @@ def _coalesce(*values: Optional[Any]) -> Optional[Any]:
     return None
 
 
+def _first(a: Optional[Any], b: Optional[Any]) -> Optional[Any]:
+    """Two-argument `_coalesce` without the varargs packing."""
+
+    return a if a is not None else b
+
+
+def _clean_str(value: Any) -> Optional[str]:
+    """Return the stripped string, or None for non-strings and blank strings."""
+
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped:
+            return stripped
+    return None
+
+
 def _normalize_sequence(
     value: Optional[Union[str, Sequence[Any]]],
     *,
@@ -28,12 +54,19 @@ def _normalize_sequence(
         return []
 
     if isinstance(value, (list, tuple, set)):
+        if cast is _strip_str and isinstance(value, list) and all(
+            isinstance(item, str) and item and item == item.strip() for item in value
+        ):
+            # Already a clean list of strings (the common Pydantic-validated case).
+            return value
         return [cast(item) for item in value if item is not None]
 
     if isinstance(value, str):
         stripped = value.strip()
         if stripped:
-            if stripped.startswith("[") and stripped.endswith("]"):
+            if len(stripped) >= 2 and stripped[0] == "[" and stripped[-1] == "]":
+                if not stripped[1:-1].strip():
+                    return []
                 try:
                     parsed = json.loads(stripped)
                 except json.JSONDecodeError:
@@ -41,8 +74,11 @@ def _normalize_sequence(
                 if isinstance(parsed, (list, tuple)):
                     return [cast(item) for item in parsed if item is not None]
 
-            parts = re.split(r"[\n,]", stripped)
-            return [cast(part.strip()) for part in parts if part and part.strip()]
+            if "," not in stripped and "\n" not in stripped:
+                return [cast(stripped)]
+
+            parts = stripped.translate(_SPLIT_TRANS).split(",")
+            return [cast(cleaned) for part in parts if (cleaned := part.strip())]
 
         return []
 
@@ -50,10 +86,25 @@ def _normalize_sequence(
     return [cast(value)]
 
 
+def _strip_str(item: Any) -> str:
+    """Cast used by `_ensure_list_of_strings`; also marks the string fast path."""
+
+    return str(item).strip()
+
+
+@lru_cache(maxsize=1024)
+def _split_string_list(value: str) -> Tuple[str, ...]:
+    """Parse one string form of a string list; sessions tend to resend the same strings."""
+
+    return tuple(_normalize_sequence(value, cast=_strip_str))
+
+
 def _ensure_list_of_strings(value: Optional[Union[str, Sequence[Any]]]) -> List[str]:
     """Normalize value into list of strings with whitespace trimmed."""
 
-    return _normalize_sequence(value, cast=lambda item: str(item).strip())
+    if isinstance(value, str):
+        return list(_split_string_list(value))
+    return _normalize_sequence(value, cast=_strip_str)
 
 
 def _ensure_list_of_facets(value: Optional[Union[str, Sequence[Any]]]) -> List[str]:
@@ -63,28 +114,38 @@ def _ensure_list_of_facets(value: Optional[Union[str, Sequence[Any]]]) -> List[s
         return []
 
     if isinstance(value, (list, tuple, set)):
-        return [str(item).strip() for item in value if str(item).strip()]
+        if isinstance(value, list) and all(isinstance(item, str) and item and item == item.strip() for item in value):
+            # Already a clean list of facet strings, as the tool's validation usually produces.
+            return value
+        return [stripped for item in value if (stripped := str(item).strip())]
 
     if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return []
+        return list(_split_facets(value))
 
-        if stripped.startswith("[") and stripped.endswith("]"):
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                parsed = None
-            if isinstance(parsed, (list, tuple, set)):
-                return [str(item).strip() for item in parsed if str(item).strip()]
+    return [str(value).strip()]
 
-        lines = [line.strip() for line in stripped.splitlines() if line.strip()]
-        if lines:
-            return lines
 
-        return [stripped]
+@lru_cache(maxsize=256)
+def _split_facets(value: str) -> Tuple[str, ...]:
+    """Parse one string form of a facet list (JSON array or one facet per line)."""
 
-    return [str(value).strip()]
+    stripped = value.strip()
+    if not stripped:
+        return ()
+
+    if stripped.startswith("[") and stripped.endswith("]"):
+        try:
+            parsed = json.loads(stripped)
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, (list, tuple, set)):
+            return tuple(str(item).strip() for item in parsed if str(item).strip())
+
+    lines = tuple(line.strip() for line in stripped.splitlines() if line.strip())
+    if lines:
+        return lines
+
+    return (stripped,)
 
 
 def _ensure_list_of_ints(value: Optional[Union[str, Sequence[Any]]]) -> List[int]:
@@ -102,19 +163,28 @@ def _ensure_list_of_floats(value: Optional[Union[str, Sequence[Any]]]) -> List[f
 def _list_to_field_value(values: Sequence[str]) -> Optional[List[str]]:
     """Convert list of strings to the list representation expected by Azure SDK."""
 
-    cleaned = [value for value in (value.strip() for value in values) if value]
+    cleaned = [stripped for value in values if (stripped := value.strip())]
     if not cleaned:
         return None
 
     return cleaned
 
 
+@lru_cache(maxsize=128)
+def _join_fields(values: Tuple[str, ...]) -> Optional[str]:
+    """Comma-join field names for parameters the Azure SDK accepts pre-joined (such as `select`)."""
+
+    return ",".join(cleaned) if (cleaned := _list_to_field_value(values)) else None
+
+
 def _vector_field_selector(values: Sequence[str]) -> str:
     """Render vector field value for the Azure SDK (comma-separated)."""
 
-    cleaned = [value for value in (value.strip() for value in values) if value]
+    cleaned = [stripped for value in values if (stripped := value.strip())]
     if not cleaned:
         return "text_vector"
+    if len(cleaned) == 1:
+        return cleaned[0]
 
     return ",".join(cleaned)
 
@@ -122,7 +192,56 @@ def _vector_field_selector(values: Sequence[str]) -> str:
 def _normalize_vector_descriptors(
     value: Optional[Union[str, Sequence[Any]]]
 ) -> List[tuple[str, Optional[int], Optional[float], Optional[str]]]:
-    """Normalize vector inputs into (text, k, weight, query_rewrites) tuples."""
+    """Normalize vector inputs into (text, k, weight, query_rewrites) tuples.
+
+    Strings and sequences of strings or ``[text, k, weight, rewrites]`` entries with
+    primitive values are parsed once and then served from a cache; anything else is
+    parsed on every call.
+    """
+
+    if isinstance(value, str):
+        return list(_cached_vector_descriptors(value))
+    if isinstance(value, (list, tuple)):
+        key = _descriptor_cache_key(value)
+        if key is not None:
+            return list(_cached_vector_descriptors(key))
+    return _parse_vector_descriptors(value)
+
+
+_DESCRIPTOR_SCALARS = (str, int, float, type(None))
+
+
+def _descriptor_cache_key(value: Sequence[Any]) -> Optional[Tuple[Any, ...]]:
+    """Hashable, parse-equivalent copy of a descriptor sequence, or None if it holds other types.
+
+    Entry parts are parsed from their ``str()`` form, so they are keyed by it too; this
+    keeps values that compare equal but parse differently (``1`` and ``1.0``) apart.
+    """
+
+    key: List[Any] = []
+    for entry in value:
+        if isinstance(entry, str):
+            key.append(entry)
+        elif isinstance(entry, (list, tuple)) and all(isinstance(part, _DESCRIPTOR_SCALARS) for part in entry):
+            key.append(tuple(part if part is None else str(part) for part in entry))
+        else:
+            return None
+    return tuple(key)
+
+
+@lru_cache(maxsize=1024)
+def _cached_vector_descriptors(
+    value: Union[str, Tuple[Any, ...]]
+) -> Tuple[tuple[str, Optional[int], Optional[float], Optional[str]], ...]:
+    """Memoized `_parse_vector_descriptors` for hashable inputs."""
+
+    return tuple(_parse_vector_descriptors(value))
+
+
+def _parse_vector_descriptors(
+    value: Optional[Union[str, Sequence[Any]]]
+) -> List[tuple[str, Optional[int], Optional[float], Optional[str]]]:
+    """Parse vector inputs into (text, k, weight, query_rewrites) tuples."""
 
     descriptors: List[tuple[str, Optional[int], Optional[float], Optional[str]]] = []
 
@@ -171,19 +290,13 @@ def _normalize_vector_descriptors(
                 try:
                     k_value = int(str(entry[1]).strip())
                 except (TypeError, ValueError):
-                    print(
-                        f"Warning: unable to parse vector k from '{entry[1]}'",
-                        file=sys.stderr,
-                    )
+                    logger.warning("unable to parse vector k from '%s'", entry[1])
 
             if len(entry) > 2 and entry[2] not in (None, ""):
                 try:
                     weight_value = float(str(entry[2]).strip())
                 except (TypeError, ValueError):
-                    print(
-                        f"Warning: unable to parse vector weight from '{entry[2]}'",
-                        file=sys.stderr,
-                    )
+                    logger.warning("unable to parse vector weight from '%s'", entry[2])
 
             if len(entry) > 3 and entry[3] not in (None, ""):
                 rewrites_value = str(entry[3]).strip()
@@ -225,8 +338,12 @@ def _normalize_vector_descriptors(
     return descriptors
 
 
+@lru_cache(maxsize=32)
 def _parse_semantic_captions(value: str) -> tuple[dict[str, Any], bool]:
-    """Translate REST-style captions string into SDK keyword arguments and return highlight flag."""
+    """Translate REST-style captions string into SDK keyword arguments and return highlight flag.
+
+    Results are cached and shared between calls; callers must not mutate the returned dict.
+    """
 
     if not value:
         return {}, False
@@ -251,8 +368,12 @@ def _parse_semantic_captions(value: str) -> tuple[dict[str, Any], bool]:
     return payload, bool(highlight)
 
 
+@lru_cache(maxsize=32)
 def _parse_semantic_answers(value: str) -> dict[str, Any]:
-    """Translate REST-style answers string into SDK keyword arguments."""
+    """Translate REST-style answers string into SDK keyword arguments.
+
+    Results are cached and shared between calls; callers must not mutate the returned dict.
+    """
 
     if not value:
         return {}
@@ -267,12 +388,12 @@ def _parse_semantic_answers(value: str) -> dict[str, Any]:
             try:
                 answer_count = int(lowered.split("-", 1)[-1])
             except ValueError:
-                print(f"Warning: unable to parse answer count from '{part}'", file=sys.stderr)
+                logger.warning("unable to parse answer count from '%s'", part)
         elif lowered.startswith("threshold-"):
             try:
                 answer_threshold = float(lowered.split("-", 1)[-1])
             except ValueError:
-                print(f"Warning: unable to parse answer threshold from '{part}'", file=sys.stderr)
+                logger.warning("unable to parse answer threshold from '%s'", part)
         else:
             answer_type = part
 
@@ -293,10 +414,15 @@ def _try_parse_int(value: Optional[Union[str, int]]) -> Optional[int]:
     if value is None:
         return None
 
+    text = str(value).strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    if digits.isdecimal():
+        return int(text)
+    # Rarer forms int() also accepts (such as "1_000") take the slow path.
     try:
-        return int(str(value).strip())
-    except (TypeError, ValueError):
-        print(f"Warning: unable to parse integer from value '{value}'", file=sys.stderr)
+        return int(text)
+    except ValueError:
+        logger.warning("unable to parse integer from value '%s'", value)
         return None
 
 
@@ -306,10 +432,14 @@ def _try_parse_float(value: Optional[Union[str, float]]) -> Optional[float]:
     if value is None:
         return None
 
+    text = str(value).strip()
+    if _FLOAT_RE.fullmatch(text):
+        return float(text)
+    # Rarer forms float() also accepts (such as "1_000", "inf" or "nan") take the slow path.
     try:
-        return float(str(value).strip())
-    except (TypeError, ValueError):
-        print(f"Warning: unable to parse float from value '{value}'", file=sys.stderr)
+        return float(text)
+    except ValueError:
+        logger.warning("unable to parse float from value '%s'", value)
         return None
 
 
@@ -0,0 +1,216 @@
+"""Docker image helpers shared by the integration runner, the pytest fixtures and scripts/debug_sse.py."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import httpx  # type: ignore[import]
+
+
+REPO_ROOT = Path(__file__).resolve().parent
+DOCKER_AVAILABLE = shutil.which("docker") is not None
+IMAGE_REPOSITORY = "azure-search-mcp-it"
+# Long-lived container reused across runs when MCP_IT_KEEP_WARM is on.
+WARM_CONTAINER = "azure-search-mcp-it-warm"
+_ENV_LABEL = "mcp-it.env"
+# Lines of a captured ``docker build`` log kept for error reports.
+_BUILD_LOG_TAIL = 200
+_INSPECT_FORMAT = '{{.State.Running}} {{.Config.Image}} {{index .Config.Labels "%s"}}' % _ENV_LABEL
+
+
+def _image_inputs(context: Path) -> Iterable[Path]:
+    """Files whose contents decide what the server image runs."""
+
+    for name in ("Dockerfile", ".dockerignore", "azure_search_server.py"):
+        path = context / name
+        if path.is_file():
+            yield path
+    yield from sorted((context / "azure_search_server_core").rglob("*.py"))
+
+
+def image_tag(context: Path = REPO_ROOT) -> str:
+    """Content-addressed tag: unchanged server sources map to the same, reusable image."""
+
+    digest = hashlib.sha256()
+    for path in _image_inputs(context):
+        digest.update(path.relative_to(context).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return f"{IMAGE_REPOSITORY}:{digest.hexdigest()[:12]}"
+
+
+def image_exists(tag: str) -> bool:
+    result = subprocess.run(
+        ["docker", "image", "inspect", tag],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+def build_image(tag: str, *, context: Path = REPO_ROOT, capture_output: bool = True) -> subprocess.CompletedProcess[str]:
+    """Run ``docker build`` with BuildKit so unchanged layers come from the local cache.
+
+    With ``capture_output`` the combined log is streamed and only its last
+    ``_BUILD_LOG_TAIL`` lines are kept, returned as ``stdout``. A successful build
+    of a content-addressed tag (see ``image_tag``) prunes the images it supersedes,
+    so source edits do not pile up images.
+    """
+
+    cmd = ["docker", "build", "-t", tag, str(context)]
+    env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+    if not capture_output:
+        result = subprocess.run(cmd, env=env, text=True, check=False)
+    else:
+        with subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+            assert proc.stdout is not None
+            tail = deque(proc.stdout, maxlen=_BUILD_LOG_TAIL)
+            returncode = proc.wait()
+        result = subprocess.CompletedProcess(cmd, returncode, stdout="".join(tail), stderr="")
+
+    if result.returncode == 0 and tag.startswith(f"{IMAGE_REPOSITORY}:"):
+        prune_images(keep=tag)
+    return result
+
+
+def prune_images(keep: str) -> List[str]:
+    """Remove integration images other than ``keep`` plus dangling layers; return the removed tags.
+
+    Images still used by a container (such as the warm one) are left in place.
+    """
+
+    listing = subprocess.run(
+        ["docker", "image", "ls", IMAGE_REPOSITORY, "--format", "{{.Repository}}:{{.Tag}}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    stale = [tag for tag in listing.stdout.split() if tag != keep]
+    if stale:
+        subprocess.run(["docker", "image", "rm", *stale], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    subprocess.run(["docker", "image", "prune", "-f"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return stale
+
+
+def find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def collect_container_env() -> Dict[str, str]:
+    """AZURE_SEARCH_* settings from the host plus the SSE listener the port mapping expects."""
+
+    container_env: Dict[str, str] = {
+        key: value for key, value in os.environ.items() if key.startswith("AZURE_SEARCH_")
+    }
+    container_env["MCP_TRANSPORT"] = "sse"
+    container_env["MCP_HOST"] = "0.0.0.0"
+    container_env["MCP_PORT"] = "8080"
+    return container_env
+
+
+def stop_container(name: str) -> None:
+    subprocess.run(["docker", "stop", name], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def keep_warm() -> bool:
+    return os.getenv("MCP_IT_KEEP_WARM", "false").lower() in {"1", "true", "yes", "on"}
+
+
+def _env_fingerprint(env_map: Dict[str, str]) -> str:
+    return hashlib.sha256(json.dumps(env_map, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def run_command(tag: str, *, name: str, host_port: int, env_map: Dict[str, str], warm: bool = False) -> List[str]:
+    """``docker run`` arguments; a warm container outlives the run and is labelled with its env."""
+
+    cmd = ["docker", "run", "-d", "--name", name, "-p", f"{host_port}:8080"]
+    if warm:
+        cmd.extend(["--label", f"{_ENV_LABEL}={_env_fingerprint(env_map)}"])
+    else:
+        cmd.append("--rm")
+    for key, value in env_map.items():
+        cmd.extend(["-e", f"{key}={value}"])
+    cmd.append(tag)
+    return cmd
+
+
+def warm_container_url(tag: str, env_map: Dict[str, str]) -> Optional[str]:
+    """SSE URL of the warm container if it is running ``tag`` with ``env_map``, else None."""
+
+    inspect = subprocess.run(
+        ["docker", "inspect", "-f", _INSPECT_FORMAT, WARM_CONTAINER],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if inspect.returncode != 0 or inspect.stdout.split() != ["true", tag, _env_fingerprint(env_map)]:
+        return None
+
+    port = subprocess.run(["docker", "port", WARM_CONTAINER, "8080/tcp"], capture_output=True, text=True, check=False)
+    if port.returncode != 0 or not port.stdout.strip():
+        return None
+    host_port = port.stdout.splitlines()[0].rsplit(":", 1)[1]
+    return f"http://127.0.0.1:{host_port}/sse"
+
+
+def wait_for_sse(url: str, timeout: float = 60.0) -> bool:
+    """Poll ``url`` until it answers an SSE GET with 200, backing off from 20ms to 500ms.
+
+    Each attempt first checks that the port accepts TCP connections, which is far cheaper
+    than an HTTP round trip while the server is still starting.
+    """
+
+    parts = urlsplit(url)
+    address = (parts.hostname or "127.0.0.1", parts.port or 80)
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    with httpx.Client(timeout=httpx.Timeout(0.5, read=2.0)) as client:
+        while True:
+            try:
+                socket.create_connection(address, timeout=0.1).close()
+                with client.stream("GET", url, headers={"Accept": "text/event-stream"}) as response:
+                    if response.status_code == httpx.codes.OK:
+                        return True
+            except Exception:
+                pass
+            if time.monotonic() + delay >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(0.5, delay * 1.5)
+
+
+def remove_container(name: str) -> None:
+    subprocess.run(["docker", "rm", "-f", name], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+__all__ = [
+    "DOCKER_AVAILABLE",
+    "IMAGE_REPOSITORY",
+    "REPO_ROOT",
+    "WARM_CONTAINER",
+    "build_image",
+    "collect_container_env",
+    "find_free_port",
+    "image_exists",
+    "image_tag",
+    "keep_warm",
+    "prune_images",
+    "remove_container",
+    "run_command",
+    "stop_container",
+    "wait_for_sse",
+    "warm_container_url",
+]
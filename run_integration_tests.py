@@ -1,35 +1,42 @@
 #!/usr/bin/env python3
 """Integration test runner for the Azure AI Search MCP server.
 
-Runs the integration test suite twice when enabled:
+Runs the integration test suite twice, concurrently, when enabled:
 1. Against the in-process server (importing the package directly).
 2. Against a Dockerized server built from the current workspace.
+
+With MCP_IT_KEEP_WARM=1 the Docker container is left running and reused by later runs
+while the image and AZURE_SEARCH_* settings are unchanged; pass --cold to recreate it.
+Building a new image removes the ones it supersedes; --prune-images also cleans up
+when the current image is reused.
 """
 
 from __future__ import annotations
 
+import importlib.util
 import os
-import shutil
-import socket
 import subprocess
 import sys
-import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
-import httpx  # type: ignore[import]
 from dotenv import load_dotenv  # type: ignore[import]
 
+import docker_utils
+
 
 TEST_DIR = Path(__file__).parent / "tests" / "integration"
 
 
-def _run_pytest(env_overrides: Dict[str, str], passthrough: List[str], label: str) -> subprocess.CompletedProcess[bytes]:
+def _run_pytest(env_overrides: Dict[str, str], passthrough: List[str], label: str) -> int:
     env = os.environ.copy()
     env.update(env_overrides)
 
-    print(f"\n🚀 Running integration tests ({label})...")
+    # Both targets run at once, so tag every output line with the run it belongs to.
+    prefix = f"[{env_overrides['INTEGRATION_TARGETS']}] "
+    print(f"{prefix}🚀 Running integration tests ({label})...")
 
     cmd = [
         sys.executable,
@@ -40,153 +47,117 @@ def _run_pytest(env_overrides: Dict[str, str], passthrough: List[str], label: st
         "--tb=short",
         "--color=yes",
     ]
+    if importlib.util.find_spec("xdist") is not None and not any(arg.startswith("-n") for arg in passthrough):
+        cmd.extend(["-n", "auto", "--dist", "loadgroup"])
     cmd.extend(passthrough)
 
-    return subprocess.run(cmd, env=env, check=False)
-
-
-def _find_free_port() -> int:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.bind(("127.0.0.1", 0))
-        return sock.getsockname()[1]
+    with subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            sys.stdout.write(prefix + line)
+        return proc.wait()
 
 
-def _wait_for_sse(url: str, timeout: float = 60.0) -> bool:
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            with httpx.Client(timeout=httpx.Timeout(2.0, read=2.0)) as client:
-                with client.stream("GET", url, headers={"Accept": "text/event-stream"}) as response:
-                    if response.status_code == httpx.codes.OK:
-                        return True
-        except Exception:
-            pass
-        time.sleep(1.0)
-    return False
+def _docker_print(message: str) -> None:
+    """Print Docker-phase output; it runs beside the in-process pass, so every line is tagged."""
 
-
-def _collect_container_env() -> Dict[str, str]:
-    container_env: Dict[str, str] = {
-        key: value for key, value in os.environ.items() if key.startswith("AZURE_SEARCH_")
-    }
-    container_env.setdefault("MCP_TRANSPORT", os.getenv("MCP_TRANSPORT", "sse"))
-    container_env.setdefault("MCP_HOST", os.getenv("MCP_HOST", "0.0.0.0"))
-    if os.getenv("MCP_PORT"):
-        container_env["MCP_PORT"] = os.getenv("MCP_PORT", "8080")
-    return container_env
+    sys.stdout.write("".join(f"[docker] {line}\n" for line in message.strip("\n").splitlines()))
 
 
 def _build_docker_image(tag: str) -> int:
-    print("\n🔧 Building Docker image for integration tests...")
-    result = subprocess.run([
-        "docker",
-        "build",
-        "-t",
-        tag,
-        ".",
-    ], check=False)
+    if docker_utils.image_exists(tag):
+        _docker_print(f"✅ Reusing cached Docker image {tag}.")
+        return 0
+
+    _docker_print("🔧 Building Docker image for integration tests...")
+    # Captured rather than streamed, so the build log does not interleave with the in-process run.
+    result = docker_utils.build_image(tag, capture_output=True)
     if result.returncode != 0:
-        print("❌ Docker build failed.")
+        _docker_print(f"❌ Docker build failed.\n{result.stdout}")
     else:
-        print("✅ Docker image built successfully.")
+        _docker_print("✅ Docker image built successfully.")
     return result.returncode
 
 
-def _start_container(tag: str, name: str, host_port: int, env_map: Dict[str, str]) -> tuple[int, str]:
-    docker_env_args: List[str] = []
-    for key, value in env_map.items():
-        docker_env_args.extend(["-e", f"{key}={value}"])
-
-    cmd = [
-        "docker",
-        "run",
-        "--rm",
-        "-d",
-        "--name",
-        name,
-        "-p",
-        f"{host_port}:8080",
-        *docker_env_args,
-        tag,
-    ]
+def _start_container(tag: str, name: str, host_port: int, env_map: Dict[str, str], *, warm: bool) -> tuple[int, str]:
+    cmd = docker_utils.run_command(tag, name=name, host_port=host_port, env_map=env_map, warm=warm)
 
     result = subprocess.run(cmd, capture_output=True, text=True, check=False)
     if result.returncode != 0:
-        print("❌ Failed to start Docker container.")
-        if result.stderr:
-            print(result.stderr.strip())
+        _docker_print(f"❌ Failed to start Docker container.\n{result.stderr}")
         return result.returncode, ""
 
     container_id = result.stdout.strip()
     if container_id:
-        print(f"✅ Docker container started: {container_id[:12]}")
+        _docker_print(f"✅ Docker container started: {container_id[:12]}")
     return 0, container_id
 
 
-def _stop_container(name: str) -> None:
-    subprocess.run([
-        "docker",
-        "stop",
-        name,
-    ], check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-
-def _remove_image(tag: str) -> None:
-    subprocess.run([
-        "docker",
-        "image",
-        "rm",
-        "-f",
-        tag,
-    ], check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def _run_docker_pytest(sse_url: str, passthrough: List[str]) -> int:
+    return _run_pytest(
+        {
+            "INTEGRATION_TARGETS": "docker",
+            "INTEGRATION_SSE_URL": sse_url,
+        },
+        passthrough,
+        "Dockerized server",
+    )
 
 
-def _run_docker_integration_tests(passthrough: List[str]) -> int:
-    if shutil.which("docker") is None:
-        print("⚠️ Docker executable not found; skipping container-based integration tests.")
+def _run_docker_integration_tests(passthrough: List[str], *, cold: bool = False, prune: bool = False) -> int:
+    if not docker_utils.DOCKER_AVAILABLE:
+        _docker_print("⚠️ Docker executable not found; skipping container-based integration tests.")
         return 0
 
-    image_tag = f"azure-search-mcp-it:{uuid.uuid4().hex[:12]}"
-    container_name = f"azure-search-mcp-it-{uuid.uuid4().hex[:8]}"
-
-    image_built = False
+    image_tag = docker_utils.image_tag()
+    if prune:
+        removed = docker_utils.prune_images(keep=image_tag)
+        _docker_print(f"🧹 Pruned {len(removed)} stale integration image(s).")
+    env_map = docker_utils.collect_container_env()
+    warm = docker_utils.keep_warm()
+
+    if warm and not cold:
+        sse_url = docker_utils.warm_container_url(image_tag, env_map)
+        if sse_url and docker_utils.wait_for_sse(sse_url, timeout=3.0):
+            _docker_print(f"♻️ Reusing warm container {docker_utils.WARM_CONTAINER} at {sse_url}.")
+            return _run_docker_pytest(sse_url, passthrough)
+    if warm:
+        docker_utils.remove_container(docker_utils.WARM_CONTAINER)
+
+    container_name = docker_utils.WARM_CONTAINER if warm else f"azure-search-mcp-it-{uuid.uuid4().hex[:8]}"
     container_started = False
 
     try:
         build_rc = _build_docker_image(image_tag)
         if build_rc != 0:
             return build_rc
-        image_built = True
 
-        env_map = _collect_container_env()
-        host_port = _find_free_port()
+        host_port = docker_utils.find_free_port()
 
-        start_rc, _ = _start_container(image_tag, container_name, host_port, env_map)
+        start_rc, _ = _start_container(image_tag, container_name, host_port, env_map, warm=warm)
         if start_rc != 0:
             return start_rc
         container_started = True
 
         sse_url = f"http://127.0.0.1:{host_port}/sse"
-        print(f"⏳ Waiting for SSE endpoint at {sse_url}...")
-        if not _wait_for_sse(sse_url):
-            print("❌ SSE endpoint did not become ready in time.")
-            subprocess.run(["docker", "logs", container_name], check=False)
+        _docker_print(f"⏳ Waiting for SSE endpoint at {sse_url}...")
+        if not docker_utils.wait_for_sse(sse_url):
+            logs = subprocess.run(
+                ["docker", "logs", container_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                check=False,
+            )
+            _docker_print(f"❌ SSE endpoint did not become ready in time.\n{logs.stdout}")
+            if warm:
+                docker_utils.remove_container(container_name)
             return 1
 
-        result = _run_pytest(
-            {
-                "INTEGRATION_TARGETS": "docker",
-                "INTEGRATION_SSE_URL": sse_url,
-            },
-            passthrough,
-            "Dockerized server",
-        )
-        return result.returncode
+        return _run_docker_pytest(sse_url, passthrough)
     finally:
-        if container_started:
-            _stop_container(container_name)
-        if image_built:
-            _remove_image(image_tag)
+        if container_started and not warm:
+            docker_utils.stop_container(container_name)
 
 
 def main() -> int:
@@ -233,6 +204,9 @@ def main() -> int:
     if "--yes" in sys.argv or "-y" in sys.argv:
         response = "y"
         print("y (auto-confirmed)")
+    elif os.getenv("CI") or not sys.stdin.isatty():
+        response = "y"
+        print("y (auto-confirmed: non-interactive)")
     else:
         response = input().lower()
 
@@ -240,14 +214,15 @@ def main() -> int:
         print("❌ Tests cancelled by user")
         return 1
 
-    passthrough = [arg for arg in sys.argv[1:] if arg not in ["--yes", "-y"]]
-
-    manual_result = _run_pytest({"INTEGRATION_TARGETS": "manual"}, passthrough, "in-process server")
-    if manual_result.returncode != 0:
-        return manual_result.returncode
+    cold = "--cold" in sys.argv
+    prune = "--prune-images" in sys.argv
+    passthrough = [arg for arg in sys.argv[1:] if arg not in ["--yes", "-y", "--cold", "--prune-images"]]
 
-    docker_result = _run_docker_integration_tests(passthrough)
-    return docker_result
+    # The two targets share no state (the index is only read), so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        manual_run = executor.submit(_run_pytest, {"INTEGRATION_TARGETS": "manual"}, passthrough, "in-process server")
+        docker_run = executor.submit(_run_docker_integration_tests, passthrough, cold=cold, prune=prune)
+        return manual_run.result() or docker_run.result()
 
 
 if __name__ == "__main__":
@@ -5,34 +5,32 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
-import socket
 import subprocess
 import sys
-import time
 import uuid
 from pathlib import Path
 from typing import Any, Dict
 
 import anyio
-import httpx
 from dotenv import load_dotenv  # type: ignore[import]
 from mcp.client.session_group import ClientSessionGroup, SseServerParameters  # type: ignore[import]
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
+import docker_utils  # noqa: E402
 
-def build_image(tag: str, *, context: Path, verbose: bool) -> None:
-    cmd = [
-        "docker",
-        "build",
-        "-t",
-        tag,
-        str(context),
-    ]
-    print(f"[build] Docker image command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=not verbose, text=True, check=False)
+
+def build_image(tag: str, *, context: Path, verbose: bool, reuse: bool) -> None:
+    # Only a content-addressed tag proves the image matches the sources; a user tag is always rebuilt.
+    if reuse and docker_utils.image_exists(tag):
+        print(f"[build] Reusing cached Docker image {tag}")
+        return
+
+    print(f"[build] Building Docker image {tag} from {context}")
+    result = docker_utils.build_image(tag, context=context, capture_output=not verbose)
     if verbose:
         result.check_returncode()
         return
@@ -44,12 +42,6 @@ def build_image(tag: str, *, context: Path, verbose: bool) -> None:
         raise SystemExit(result.returncode)
 
 
-def find_free_port() -> int:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.bind(("127.0.0.1", 0))
-        return sock.getsockname()[1]
-
-
 def run_container(tag: str, *, name: str, host_port: int, env_map: Dict[str, str], verbose: bool) -> str:
     cmd = [
         "docker",
@@ -81,16 +73,9 @@ def run_container(tag: str, *, name: str, host_port: int, env_map: Dict[str, str
 
 def wait_for_sse(url: str, *, timeout: float, container_name: str) -> None:
     print(f"[wait] Waiting for SSE endpoint {url} ...")
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            with httpx.Client(timeout=httpx.Timeout(2.0, read=2.0)) as client:
-                with client.stream("GET", url, headers={"Accept": "text/event-stream"}) as response:
-                    if response.status_code == httpx.codes.OK:
-                        print("[wait] SSE endpoint is ready.")
-                        return
-        except Exception:
-            time.sleep(1)
+    if docker_utils.wait_for_sse(url, timeout):
+        print("[wait] SSE endpoint is ready.")
+        return
 
     logs = subprocess.run(["docker", "logs", container_name], capture_output=True, text=True, check=False)
     sys.stderr.write("ERROR: SSE endpoint did not become ready in time.\n")
@@ -123,24 +108,6 @@ async def call_search(url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         raise RuntimeError("Structured content missing from response.")
 
 
-def stop_container(name: str) -> None:
-    subprocess.run(["docker", "stop", name], check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-
-def remove_image(tag: str) -> None:
-    subprocess.run(["docker", "image", "rm", "-f", tag], check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-
-def collect_container_env() -> Dict[str, str]:
-    env_map: Dict[str, str] = {
-        key: value for key, value in os.environ.items() if key.startswith("AZURE_SEARCH_")
-    }
-    env_map["MCP_TRANSPORT"] = "sse"
-    env_map["MCP_HOST"] = "0.0.0.0"
-    env_map["MCP_PORT"] = "8080"
-    return env_map
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--search", default="test", help="Lexical search string to send to the tool.")
@@ -149,11 +116,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--keep-artifacts",
         action="store_true",
-        help="Do not stop the container or remove the image after the call.",
+        help="Do not stop the container after the call.",
     )
     parser.add_argument(
         "--image-tag",
-        help="Optional custom Docker image tag. Defaults to a random tag per run.",
+        help="Optional custom Docker image tag, always rebuilt. Defaults to a tag derived from the server sources, reused while they are unchanged.",
     )
     parser.add_argument(
         "--host-port",
@@ -172,14 +139,11 @@ def main() -> int:
     args = parse_args()
     load_dotenv(REPO_ROOT / ".env")
 
-    if args.image_tag:
-        image_tag = args.image_tag
-    else:
-        image_tag = f"azure-search-mcp-it:{uuid.uuid4().hex[:12]}"
+    image_tag = args.image_tag or docker_utils.image_tag(REPO_ROOT)
 
     container_name = f"azure-search-mcp-it-{uuid.uuid4().hex[:8]}"
-    host_port = args.host_port or find_free_port()
-    container_env = collect_container_env()
+    host_port = args.host_port or docker_utils.find_free_port()
+    container_env = docker_utils.collect_container_env()
 
     print(f"[info] Repo root: {REPO_ROOT}")
     print(f"[info] Image tag: {image_tag}")
@@ -187,7 +151,7 @@ def main() -> int:
     print(f"[info] Host port: {host_port}")
 
     try:
-        build_image(image_tag, context=REPO_ROOT, verbose=args.verbose)
+        build_image(image_tag, context=REPO_ROOT, verbose=args.verbose, reuse=args.image_tag is None)
         run_container(image_tag, name=container_name, host_port=host_port, env_map=container_env, verbose=args.verbose)
         sse_url = f"http://127.0.0.1:{host_port}/sse"
         wait_for_sse(sse_url, timeout=args.timeout, container_name=container_name)
@@ -202,11 +166,10 @@ def main() -> int:
         print(structured)
     finally:
         if args.keep_artifacts:
-            print("[info] Leaving container and image running per --keep-artifacts.")
+            print("[info] Leaving container running per --keep-artifacts.")
         else:
-            print("[cleanup] Stopping container and removing image...")
-            stop_container(container_name)
-            remove_image(image_tag)
+            print("[cleanup] Stopping container...")
+            docker_utils.stop_container(container_name)
 
     return 0
 
@@ -1,17 +1,14 @@
 import json
 import os
-import shutil
-import socket
 import subprocess
 import sys
-import time
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, AsyncIterator, Callable, Dict
 
-import anyio
-import httpx  # type: ignore[import]
+from anyio.from_thread import start_blocking_portal
 import pytest
 from dotenv import load_dotenv  # type: ignore[import]
 
@@ -24,6 +21,8 @@ ROOT_STR = str(ROOT)
 if ROOT_STR not in sys.path:
     sys.path.insert(0, ROOT_STR)
 
+import docker_utils  # noqa: E402
+
 
 load_dotenv()
 
@@ -44,7 +43,7 @@ def _resolve_integration_modes() -> list[str]:
 
     modes = ["manual"]
     should_consider_docker = os.getenv("ENABLE_INTEGRATION_TESTS", "false").lower() == "true"
-    if should_consider_docker and shutil.which("docker") is not None:
+    if should_consider_docker and docker_utils.DOCKER_AVAILABLE:
         modes.append("docker")
     return modes
 
@@ -55,146 +54,153 @@ def _require_env(vars_: list[str]) -> None:
         pytest.skip(f"Missing Azure Search configuration: {', '.join(missing)}")
 
 
-def _call_search_via_sse(url: str, arguments: dict[str, Any]) -> dict[str, Any]:
-    async def _run(payload: dict[str, Any]) -> dict[str, Any]:
-        async with ClientSessionGroup() as group:
-            await group.connect_to_server(SseServerParameters(url=url))
-            result = await group.call_tool("search", payload)
-            if result.isError:
-                raise AssertionError(f"MCP search tool returned error: {result}")
-            if result.structuredContent is not None:
-                return result.structuredContent
-
-            # Fallback: parse JSON string from text content for legacy servers.
-            for entry in result.content or []:
-                try:
-                    parsed = json.loads(entry.text)
-                except Exception as exc:  # pragma: no cover - defensive logging
-                    raise AssertionError(
-                        f"Failed to parse search response text content as JSON: {exc}"
-                    ) from exc
-                if isinstance(parsed, dict):
-                    return parsed
-
-            raise AssertionError("MCP search tool response missing structured content")
-
-    return anyio.run(_run, arguments)
-
+@asynccontextmanager
+async def _connected_group(url: str) -> AsyncIterator[ClientSessionGroup]:
+    # Connect inside the group's own context: the SSE transport's task group must be
+    # entered and exited by the same task.
+    async with ClientSessionGroup() as group:
+        await group.connect_to_server(SseServerParameters(url=url))
+        yield group
 
-def _find_free_port() -> int:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.bind(("127.0.0.1", 0))
-        return sock.getsockname()[1]
 
+async def _call_search_tool(group: ClientSessionGroup, payload: dict[str, Any]) -> dict[str, Any]:
+    result = await group.call_tool("search", payload)
+    if result.isError:
+        raise AssertionError(f"MCP search tool returned error: {result}")
+    if result.structuredContent is not None:
+        return result.structuredContent
 
-def _collect_container_env() -> Dict[str, str]:
-    container_env: Dict[str, str] = {
-        key: value for key, value in os.environ.items() if key.startswith("AZURE_SEARCH_")
-    }
-    container_env.setdefault("MCP_TRANSPORT", os.getenv("MCP_TRANSPORT", "sse"))
-    container_env["MCP_HOST"] = "0.0.0.0"
-    container_env["MCP_PORT"] = "8080"
-    return container_env
-
-
-def _wait_for_sse(url: str, timeout: float = 60.0) -> bool:
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
+    # Fallback: parse JSON string from text content for legacy servers.
+    for entry in result.content or []:
         try:
-            with httpx.Client(timeout=httpx.Timeout(2.0, read=2.0)) as client:
-                with client.stream("GET", url, headers={"Accept": "text/event-stream"}) as response:
-                    if response.status_code == httpx.codes.OK:
-                        return True
-        except Exception:
-            pass
-        time.sleep(1.0)
-    return False
+            parsed = json.loads(entry.text)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            raise AssertionError(
+                f"Failed to parse search response text content as JSON: {exc}"
+            ) from exc
+        if isinstance(parsed, dict):
+            return parsed
 
+    raise AssertionError("MCP search tool response missing structured content")
 
-@pytest.fixture(scope="session")
-def docker_integration_server():
-    if os.getenv("ENABLE_INTEGRATION_TESTS", "false").lower() != "true":
-        pytest.skip("Integration tests disabled.")
 
-    if shutil.which("docker") is None:
-        pytest.skip("Docker executable not available; skipping Docker integration mode.")
+def _start_docker_server() -> Dict[str, Any]:
+    """Reuse the warm container when possible; otherwise build if needed, start and wait for SSE."""
 
-    image_tag = f"azure-search-mcp-it:{uuid.uuid4().hex[:12]}"
-    container_name = f"azure-search-mcp-it-{uuid.uuid4().hex[:8]}"
+    image_tag = docker_utils.image_tag()
+    env_map = docker_utils.collect_container_env()
+    warm = docker_utils.keep_warm()
 
-    env_map = _collect_container_env()
-    host_port = _find_free_port()
+    if warm:
+        sse_url = docker_utils.warm_container_url(image_tag, env_map)
+        if sse_url and docker_utils.wait_for_sse(sse_url, timeout=3.0):
+            return {"sse_url": sse_url, "container": docker_utils.WARM_CONTAINER, "warm": True}
+        docker_utils.remove_container(docker_utils.WARM_CONTAINER)
 
-    build_result = subprocess.run(
-        ["docker", "build", "-t", image_tag, "."],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if build_result.returncode != 0:
-        pytest.fail(
-            "Docker build failed for integration tests:\n"
-            f"STDOUT:\n{build_result.stdout}\nSTDERR:\n{build_result.stderr}"
-        )
+    container_name = docker_utils.WARM_CONTAINER if warm else f"azure-search-mcp-it-{uuid.uuid4().hex[:8]}"
+    host_port = docker_utils.find_free_port()
 
-    docker_env_args: list[str] = []
-    for key, value in env_map.items():
-        docker_env_args.extend(["-e", f"{key}={value}"])
+    if not docker_utils.image_exists(image_tag):
+        build_result = docker_utils.build_image(image_tag, context=ROOT)
+        if build_result.returncode != 0:
+            pytest.fail(
+                "Docker build failed for integration tests:\n"
+                f"STDOUT:\n{build_result.stdout}\nSTDERR:\n{build_result.stderr}"
+            )
 
     run_result = subprocess.run(
-        [
-            "docker",
-            "run",
-            "--rm",
-            "-d",
-            "--name",
-            container_name,
-            "-p",
-            f"{host_port}:8080",
-            *docker_env_args,
-            image_tag,
-        ],
+        docker_utils.run_command(image_tag, name=container_name, host_port=host_port, env_map=env_map, warm=warm),
         capture_output=True,
         text=True,
         check=False,
     )
     if run_result.returncode != 0:
-        subprocess.run(["docker", "image", "rm", "-f", image_tag], check=False)
         pytest.fail(
             "Failed to start Docker container for integration tests:\n"
             f"STDOUT:\n{run_result.stdout}\nSTDERR:\n{run_result.stderr}"
         )
 
     sse_url = f"http://127.0.0.1:{host_port}/sse"
-    if not _wait_for_sse(sse_url):
+    if not docker_utils.wait_for_sse(sse_url):
         logs = subprocess.run(
             ["docker", "logs", container_name], capture_output=True, text=True, check=False
         )
-        _stop_container(container_name)
-        _remove_image(image_tag)
+        docker_utils.remove_container(container_name)
         pytest.fail(
             "Docker MCP server did not become ready in time."
             f"\nLogs:\n{logs.stdout if logs.stdout else logs.stderr}"
         )
 
+    return {"sse_url": sse_url, "container": container_name, "warm": warm}
+
+
+def _release_docker_server(server: Dict[str, Any]) -> None:
+    if not server["warm"]:
+        docker_utils.stop_container(server["container"])
+
+
+@pytest.fixture(scope="session")
+def docker_integration_server(tmp_path_factory):
+    if os.getenv("ENABLE_INTEGRATION_TESTS", "false").lower() != "true":
+        pytest.skip("Integration tests disabled.")
+
+    if not docker_utils.DOCKER_AVAILABLE:
+        pytest.skip("Docker executable not available; skipping Docker integration mode.")
+
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        server = _start_docker_server()
+        try:
+            yield {"sse_url": server["sse_url"]}
+        finally:
+            _release_docker_server(server)
+        return
+
+    # Under pytest-xdist every worker has its own session; they share one container through
+    # a state file in the run's common temp directory. The last worker out shuts it down.
+    from filelock import FileLock  # type: ignore[import]
+
+    state_path = tmp_path_factory.getbasetemp().parent / "docker_integration_server.json"
+    lock = FileLock(f"{state_path}.lock")
+
+    with lock:
+        if state_path.is_file():
+            state = json.loads(state_path.read_text())
+        else:
+            state = {**_start_docker_server(), "users": 0}
+        state["users"] += 1
+        state_path.write_text(json.dumps(state))
+
     try:
-        yield {"sse_url": sse_url}
+        yield {"sse_url": state["sse_url"]}
     finally:
-        _stop_container(container_name)
-        _remove_image(image_tag)
+        with lock:
+            state = json.loads(state_path.read_text())
+            state["users"] -= 1
+            if state["users"]:
+                state_path.write_text(json.dumps(state))
+            else:
+                state_path.unlink()
+                _release_docker_server(state)
 
 
-def _stop_container(name: str) -> None:
-    subprocess.run(["docker", "stop", name], check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+@pytest.fixture(scope="session")
+def sse_search_session(request):
+    """Call the search tool over one MCP SSE session kept open for the whole test session.
+
+    The session lives on a background event loop; tests call into it synchronously.
+    """
 
+    sse_url = os.getenv("INTEGRATION_SSE_URL")
+    if not sse_url:
+        sse_url = request.getfixturevalue("docker_integration_server")["sse_url"]
 
-def _remove_image(tag: str) -> None:
-    subprocess.run(["docker", "image", "rm", "-f", tag], check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    with start_blocking_portal() as portal:
+        with portal.wrap_async_context_manager(_connected_group(sse_url)) as group:
+            yield lambda arguments: portal.call(_call_search_tool, group, arguments)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def azure_module():
-    load_dotenv()
     if os.getenv("ENABLE_INTEGRATION_TESTS", "false").lower() != "true":
         pytest.skip("Integration tests disabled. Set ENABLE_INTEGRATION_TESTS=true to enable.")
 
@@ -213,7 +219,7 @@ def azure_module():
     return module
 
 
-@pytest.fixture(scope="module", params=_resolve_integration_modes())
+@pytest.fixture(scope="session", params=_resolve_integration_modes())
 def integration_harness(request, azure_module):
     mode = request.param
     module = azure_module
@@ -227,14 +233,11 @@ def integration_harness(request, azure_module):
         )
 
     if mode == "docker":
-        sse_url = os.getenv("INTEGRATION_SSE_URL")
-        if not sse_url:
-            docker_server = request.getfixturevalue("docker_integration_server")
-            sse_url = docker_server["sse_url"]
+        call_search_tool = request.getfixturevalue("sse_search_session")
 
         def _call_search(**kwargs: Any) -> dict[str, Any]:
             arguments = {key: value for key, value in kwargs.items() if value is not None or key == "vectors"}
-            return _call_search_via_sse(sse_url, arguments)
+            return call_search_tool(arguments)
 
         return IntegrationHarness(
             mode=mode,
@@ -245,3 +248,11 @@ def integration_harness(request, azure_module):
 
     pytest.skip(f"Unknown integration mode: {mode}")
 
+
+def pytest_collection_modifyitems(config, items):
+    # With `-n ... --dist loadgroup`, keep the Docker-mode tests on one worker so they do
+    # not race the single SSE endpoint; manual-mode tests spread across all workers.
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and callspec.params.get("integration_harness") == "docker":
+            item.add_marker(pytest.mark.xdist_group("docker_sse"))
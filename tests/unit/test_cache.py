@@ -0,0 +1,80 @@
+import pytest  # type: ignore[import]
+
+from azure_search_server_core import cache
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    results = cache._TTLCache(maxsize=4, ttl=60)
+
+    results.put("query", {"items": []})
+    now[0] += 59
+    assert results.get("query") == {"items": []}
+
+    now[0] += 1
+    assert results.get("query") is None
+    assert len(results) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    results = cache._TTLCache(maxsize=2, ttl=60)
+
+    results.put("a", 1)
+    results.put("b", 2)
+    assert results.get("a") == 1
+    results.put("c", 3)
+
+    assert results.get("b") is None
+    assert results.get("a") == 1
+    assert results.get("c") == 3
+
+
+def test_single_flight_shares_one_computation_between_concurrent_callers(monkeypatch):
+    import threading
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    joined = threading.Semaphore(0)
+
+    class _ObservedFuture(Future):
+        def result(self, timeout=None):
+            joined.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(cache, "Future", _ObservedFuture)
+    flights = cache._SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"items": ["shared"]}
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(flights.run, "query", compute)
+        assert started.wait(5)
+        followers = [pool.submit(flights.run, "query", compute) for _ in range(2)]
+        assert joined.acquire(timeout=5) and joined.acquire(timeout=5)
+        release.set()
+        results = [leader.result(5)] + [future.result(5) for future in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flights.run("query", lambda: "fresh") == "fresh"
+
+
+def test_single_flight_propagates_errors_and_releases_the_key():
+    flights = cache._SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        flights.run("query", fail)
+    assert flights._calls == {}
@@ -0,0 +1,55 @@
+import pytest  # type: ignore[import]
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_load_defaults_parses_env_into_tuples(monkeypatch):
+    from azure_search_server_core.config import _load_defaults
+
+    monkeypatch.setenv("AZURE_SEARCH_SEARCH_FIELDS", "chunk, FullName")
+    monkeypatch.setenv("AZURE_SEARCH_VECTOR_DEFAULT_K", "33")
+    monkeypatch.delenv("AZURE_SEARCH_QUERY_REWRITES", raising=False)
+    monkeypatch.delenv("AZURE_SEARCH_SEARCH_MODE", raising=False)
+
+    defaults = _load_defaults()
+
+    assert defaults.search_fields == ("chunk", "FullName")
+    assert defaults.vector_k == 33
+    assert defaults.query_rewrites == "generative|count-5"
+    assert defaults.search_mode == "all"
+
+
+def test_load_defaults_reuses_parse_for_unchanged_env(monkeypatch):
+    from azure_search_server_core.config import _load_defaults
+
+    monkeypatch.setenv("AZURE_SEARCH_SELECT_FIELDS", "chunk")
+    first = _load_defaults()
+    assert _load_defaults() is first
+
+    monkeypatch.setenv("AZURE_SEARCH_SELECT_FIELDS", "chunk,title")
+    changed = _load_defaults()
+    assert changed is not first
+    assert changed.select_fields == ("chunk", "title")
+
+
+def test_load_defaults_normalizes_search_mode(monkeypatch):
+    from azure_search_server_core.config import _load_defaults
+
+    monkeypatch.setenv("AZURE_SEARCH_SEARCH_MODE", "ANY")
+    assert _load_defaults().search_mode == "any"
+
+    monkeypatch.setenv("AZURE_SEARCH_SEARCH_MODE", "")
+    assert _load_defaults().search_mode == "all"
+
+
+def test_load_defaults_treats_empty_field_lists_as_unset(monkeypatch):
+    from azure_search_server_core.config import _load_defaults
+
+    monkeypatch.setenv("AZURE_SEARCH_VECTOR_FIELDS", "")
+    monkeypatch.delenv("AZURE_SEARCH_SELECT_FIELDS", raising=False)
+
+    defaults = _load_defaults()
+
+    assert defaults.vector_fields == ()
+    assert defaults.select_fields == ()
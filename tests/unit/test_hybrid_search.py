@@ -1,4 +1,5 @@
 import importlib
+import logging
 import sys
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
@@ -23,56 +24,115 @@ class FakePaged:
         return self.count
 
 
+# Shared by every test; formatting only reads the rows, never mutates them.
+_FAKE_RESULTS = FakePaged(
+    items=[
+        {"title": "Doc1", "chunk": "Alpha", "@search.score": 1.0},
+        {"title": "Doc2", "chunk": "Beta", "@search.score": 0.8},
+    ],
+    count=42,
+)
+
+_SERVER_ENV = {
+    "AZURE_SEARCH_SERVICE_ENDPOINT": "https://example.search.windows.net",
+    "AZURE_SEARCH_INDEX_NAME": "example-index",
+    "AZURE_SEARCH_API_KEY": "fake-key",
+    "AZURE_SEARCH_SEMANTIC_CONFIGURATION": "semantic-config",
+    "AZURE_SEARCH_SEARCH_FIELDS": "chunk,FullName",
+    "AZURE_SEARCH_VECTOR_FIELDS": "text_vector",
+    "AZURE_SEARCH_SELECT_FIELDS": "chunk,FullName",
+    "AZURE_SEARCH_VECTOR_DEFAULT_K": "55",
+    "AZURE_SEARCH_VECTOR_DEFAULT_WEIGHT": "1.1",
+    "AZURE_SEARCH_QUERY_LANGUAGE": "en-US",
+    # Keep the startup warm-up query out of the mocked search call history.
+    "AZURE_SEARCH_PREWARM": "0",
+}
+
+
+# Arguments a tool call would pass when the caller sets nothing; tests override what they vary.
+_SEARCH_DEFAULTS = dict(
+    search_text="firmware",
+    vector_texts=[],
+    top=5,
+    skip=None,
+    count=False,
+    select_fields=None,
+    query_type=None,
+    query_language=None,
+    query_rewrites=None,
+    semantic_configuration=None,
+    captions=None,
+    answers=None,
+    search_mode=None,
+    search_fields=None,
+    vector_fields=None,
+    vector_ks=[],
+    vector_weights=[],
+    vector_rewrites=[],
+    vector_default_k=None,
+    vector_default_weight=None,
+    include_scores=False,
+    debug=None,
+)
+
+
+def _search(client, **overrides):
+    return client.hybrid_search(**{**_SEARCH_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def server_module():
+    """Import the server module once per test module, with its env set and the SDK client mocked."""
+
+    from azure_search_server_core.client import _shared_search_client
+
+    sys.modules.pop(MODULE_NAME, None)
+    # The env stays set for the whole module; per-test monkeypatch changes restore to it.
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in _SERVER_ENV.items():
+            mp.setenv(key, value)
+        with patch("azure.search.documents.SearchClient", MagicMock()):
+            module = importlib.import_module(MODULE_NAME)
+
+        yield module
+
+    _shared_search_client.cache_clear()
+    sys.modules.pop(MODULE_NAME, None)
+
+
 @pytest.fixture
-def mocked_server(monkeypatch):
-    """Load the server module with a mocked Azure Search client."""
-
-    monkeypatch.setenv("AZURE_SEARCH_SERVICE_ENDPOINT", "https://example.search.windows.net")
-    monkeypatch.setenv("AZURE_SEARCH_INDEX_NAME", "example-index")
-    monkeypatch.setenv("AZURE_SEARCH_API_KEY", "fake-key")
-    monkeypatch.setenv("AZURE_SEARCH_SEMANTIC_CONFIGURATION", "semantic-config")
-    monkeypatch.setenv("AZURE_SEARCH_SEARCH_FIELDS", "chunk,FullName")
-    monkeypatch.setenv("AZURE_SEARCH_VECTOR_FIELDS", "text_vector")
-    monkeypatch.setenv("AZURE_SEARCH_SELECT_FIELDS", "chunk,FullName")
-    monkeypatch.setenv("AZURE_SEARCH_VECTOR_DEFAULT_K", "55")
-    monkeypatch.setenv("AZURE_SEARCH_VECTOR_DEFAULT_WEIGHT", "1.1")
-    monkeypatch.setenv("AZURE_SEARCH_QUERY_LANGUAGE", "en-US")
-
-    fake_results = FakePaged(
-        items=[
-            {"title": "Doc1", "chunk": "Alpha", "@search.score": 1.0},
-            {"title": "Doc2", "chunk": "Beta", "@search.score": 0.8},
-        ],
-        count=42,
-    )
+def mocked_server(server_module, monkeypatch):
+    """Point the server module at a fresh mocked Azure Search client for one test.
+
+    Tests build their own ``AzureSearchClient``, which picks up the patched
+    ``SearchClient`` at construction, so only the mock is replaced per test.
+    """
 
     mock_search_instance = MagicMock()
-    mock_search_instance.search.return_value = fake_results
+    mock_search_instance.search.return_value = _FAKE_RESULTS
     mock_search_cls = MagicMock(return_value=mock_search_instance)
 
-    if MODULE_NAME in sys.modules:
-        del sys.modules[MODULE_NAME]
-
-    patcher = patch("azure.search.documents.SearchClient", mock_search_cls)
-    patcher.start()
-    module = importlib.import_module(MODULE_NAME)
-    patcher.stop()
-
     monkeypatch.setattr("azure_search_server_core.client.SearchClient", mock_search_cls)
+    # Drop any SDK client shared from an earlier test so this one sees its own mock.
+    from azure_search_server_core.client import _shared_search_client
+
+    _shared_search_client.cache_clear()
 
-    yield module, mock_search_cls, mock_search_instance, fake_results
+    yield server_module, mock_search_cls, mock_search_instance, _FAKE_RESULTS
 
-    if MODULE_NAME in sys.modules:
-        del sys.modules[MODULE_NAME]
+    _shared_search_client.cache_clear()
 
 
-def test_hybrid_search_builds_expected_payload(mocked_server):
+def test_hybrid_search_builds_expected_payload(mocked_server, caplog):
     module, _, mock_instance, fake_results = mocked_server
 
+    caplog.set_level(logging.INFO, logger="azure_search_server_core")
+
     # Fresh client instance to pick up environment defaults defined above
     client = module.AzureSearchClient()
 
-    payload = client.hybrid_search(
+    payload = _search(
+        client,
         search_text="firmware engineer",
         vector_texts=["embedded engineer", "firmware developer"],
         top=15,
@@ -82,7 +142,6 @@ def test_hybrid_search_builds_expected_payload(mocked_server):
         query_type="semantic",
         query_language="en-US",
         query_rewrites="generative|count-7",
-        semantic_configuration=None,
         captions="extractive|highlight-true",
         answers="extractive|count-3",
         filter_expression="DomainUserLogin eq 'jpierzchala'",
@@ -95,9 +154,6 @@ def test_hybrid_search_builds_expected_payload(mocked_server):
         vector_ks=[60, 40],
         vector_weights=[2.0, 1.5],
         vector_rewrites=["generative|count-3", None],
-        vector_default_k=None,
-        vector_default_weight=None,
-        include_scores=False,
         debug="queryRewrites",
     )
 
@@ -115,7 +171,7 @@ def test_hybrid_search_builds_expected_payload(mocked_server):
     assert "captions" not in call_kwargs
     assert "answers" not in call_kwargs
     assert call_kwargs["search_fields"] == ["chunk", "FullName"]
-    assert call_kwargs["select"] == ["chunk", "FullName"]
+    assert call_kwargs["select"] == "chunk,FullName"
     assert call_kwargs["filter"] == "DomainUserLogin eq 'jpierzchala'"
     assert call_kwargs["order_by"] == ["@search.score desc"]
     assert call_kwargs["facets"] == ["DomainUserLogin,count:10"]
@@ -139,6 +195,7 @@ def test_hybrid_search_builds_expected_payload(mocked_server):
 
     assert payload["count"] == fake_results.count
     assert len(payload["items"]) == len(fake_results.items)
+    assert payload["applied"] is None
 
 
 def test_hybrid_search_preserves_facets_string(mocked_server):
@@ -146,33 +203,11 @@ def test_hybrid_search_preserves_facets_string(mocked_server):
 
     client = module.AzureSearchClient()
 
-    client.hybrid_search(
+    _search(
+        client,
         search_text="firmware engineer",
-        vector_texts=[],
-        top=5,
-        skip=None,
-        count=False,
-        select_fields=None,
         query_type="simple",
-        query_language=None,
-        query_rewrites=None,
-        semantic_configuration=None,
-        captions=None,
-        answers=None,
-        filter_expression=None,
-        order_by=None,
         facets="DomainUserLogin,count:10,sort:desc\nLocation,count:5",
-        vector_filter_mode=None,
-        search_mode=None,
-        search_fields=None,
-        vector_fields=None,
-        vector_ks=[],
-        vector_weights=[],
-        vector_rewrites=[],
-        vector_default_k=None,
-        vector_default_weight=None,
-        include_scores=False,
-        debug=None,
     )
 
     call_kwargs = mock_instance.search.call_args.kwargs
@@ -190,33 +225,13 @@ def test_hybrid_search_requires_query_language_for_semantic(mocked_server, monke
     client = module.AzureSearchClient()
 
     with pytest.raises(ValueError) as exc:
-        client.hybrid_search(
-            search_text="firmware",
-            vector_texts=[],
-            top=5,
-            skip=None,
-            count=False,
+        _search(
+            client,
             select_fields=["chunk"],
             query_type="semantic",
-            query_language=None,
-            query_rewrites=None,
-            semantic_configuration=None,
-            captions=None,
-            answers=None,
-            filter_expression=None,
-            order_by=None,
-            facets=None,
-            vector_filter_mode=None,
             search_mode="all",
             search_fields=["chunk"],
             vector_fields=["text_vector"],
-            vector_ks=[],
-            vector_weights=[],
-            vector_rewrites=[],
-            vector_default_k=None,
-            vector_default_weight=None,
-            include_scores=False,
-            debug=None,
         )
 
     assert "Query language is required" in str(exc.value)
@@ -230,35 +245,429 @@ def test_hybrid_search_requires_semantic_configuration(mocked_server, monkeypatc
     client = module.AzureSearchClient()
 
     with pytest.raises(ValueError) as exc:
-        client.hybrid_search(
+        _search(
+            client,
             search_text="embedded developer",
             vector_texts=["firmware"],
-            top=5,
-            skip=None,
-            count=False,
             select_fields=["chunk"],
             query_type="semantic",
             query_language="en-US",
-            query_rewrites=None,
-            semantic_configuration=None,
-            captions=None,
-            answers=None,
-            filter_expression=None,
-            order_by=None,
-            facets=None,
-            vector_filter_mode=None,
             search_mode="all",
             search_fields=["chunk"],
             vector_fields=["text_vector"],
-            vector_ks=[],
-            vector_weights=[],
-            vector_rewrites=[],
-            vector_default_k=None,
-            vector_default_weight=None,
-            include_scores=False,
-            debug=None,
         )
 
     assert "Semantic configuration" in str(exc.value)
 
 
+
+
+def test_format_results_shapes_entries(mocked_server):
+    module, _, _, _ = mocked_server
+
+    client = module.AzureSearchClient()
+
+    rows = [
+        {
+            "title": "Doc1",
+            "chunk": "Alpha",
+            "@search.score": 1.5,
+            "@search.rerankerScore": 2.5,
+            "@search.captions": [{"text": "caption text", "highlights": "<em>caption</em>"}],
+        },
+        {"Chunk": "Beta", "@search.score": 0.5, "@search.captions": [{"text": "plain", "highlights": ""}]},
+        {"other": "value", "@search.score": 0.1},
+    ]
+
+    formatted = list(
+        client._format_results(
+            rows,
+            include_scores=True,
+            caption_preferences={"requested": True, "highlight": True},
+            semantic=True,
+        )
+    )
+
+    assert formatted[0] == {
+        "title": "Doc1",
+        "chunk": "Alpha",
+        "@search.caption": "<em>caption</em>",
+        "@search.score": 1.5,
+        "@search.rerankerScore": 2.5,
+    }
+    assert formatted[1] == {"chunk": "Beta", "@search.caption": "plain", "@search.score": 0.5}
+    assert formatted[2] == {"@search.score": 0.1}
+
+    both = list(client._format_results([{"Chunk": "upper", "chunk": "lower", "name": "N"}], include_scores=False))
+    assert both == [{"chunk": "lower", "name": "N"}]
+
+    selected = list(client._format_results(rows, select_fields=["chunk"], include_scores=False))
+    assert selected == [{"chunk": "Alpha"}, {"Chunk": "Beta"}, {"other": "value"}]
+
+    uniform = [
+        {"other": "a", "extra": None, "@search.score": 0.3},
+        {"other": "", "extra": "b", "@search.score": 0.2},
+        {"other": "c", "new": "d"},
+    ]
+    fallback = list(client._format_results(uniform, select_fields=["chunk"], include_scores=False))
+    assert fallback == [{"other": "a"}, {"extra": "b"}, {"other": "c", "new": "d"}]
+
+
+def test_row_formatter_is_reused_for_identical_options():
+    from azure_search_server_core.client import _row_formatter
+
+    formatter = _row_formatter(("chunk",), False, False, False, False)
+
+    assert _row_formatter(("chunk",), False, False, False, False) is formatter
+    assert _row_formatter(("chunk",), True, False, False, False) is not formatter
+    assert formatter({"chunk": "Alpha", "title": "T", "@search.score": 1.0}) == {"chunk": "Alpha"}
+
+
+def test_row_formatter_reads_semantic_fields_only_for_semantic_queries():
+    from azure_search_server_core.client import _row_formatter
+
+    row = {
+        "chunk": "Alpha",
+        "@search.score": 1.0,
+        "@search.reranker_score": 2.5,
+        "@search.captions": [{"text": "caption", "highlights": None}],
+    }
+
+    assert _row_formatter(("chunk",), True, True, False, False)(row) == {"chunk": "Alpha", "@search.score": 1.0}
+    assert _row_formatter(("chunk",), True, True, False, True)(row) == {
+        "chunk": "Alpha",
+        "@search.caption": "caption",
+        "@search.score": 1.0,
+        "@search.rerankerScore": 2.5,
+    }
+
+
+def test_caption_from_reads_models_and_dicts():
+    from types import SimpleNamespace
+
+    from azure_search_server_core.client import _caption_from
+
+    model = SimpleNamespace(text=" plain ", highlights=" <em>hit</em> ")
+    assert _caption_from([model], True) == "<em>hit</em>"
+    assert _caption_from([model], False) == "plain"
+    assert _caption_from([{"text": "plain", "highlights": "  "}], True) == "plain"
+    assert _caption_from([{"text": None}], True) is None
+    assert _caption_from([], True) is None
+
+
+def test_vector_query_models_are_reused_for_identical_descriptors():
+    from azure_search_server_core.client import _vector_query
+
+    first = _vector_query("firmware", "text_vector", 50, 1.0, None)
+
+    assert _vector_query("firmware", "text_vector", 50, 1.0, None) is first
+    assert _vector_query("firmware", "text_vector", 50, 2.0, None) is not first
+    assert first.k_nearest_neighbors == 50
+
+
+def test_hybrid_search_reads_facets_when_results_support_them(mocked_server, monkeypatch):
+    module, _, mock_instance, fake_results = mocked_server
+    monkeypatch.setenv("AZURE_SEARCH_RESULT_CACHE_TTL", "0")
+
+    class FacetedPaged(FakePaged):
+        def get_facets(self):
+            return {"DomainUserLogin": [{"value": "jdoe", "count": 3}]}
+
+    mock_instance.search.return_value = FacetedPaged(items=fake_results.items, count=fake_results.count)
+    client = module.AzureSearchClient()
+
+    assert _search(client)["facets"] == {"DomainUserLogin": [{"value": "jdoe", "count": 3}]}
+
+    mock_instance.search.return_value = fake_results
+    assert _search(client)["facets"] is None
+
+
+def test_build_payload_splits_sdk_kwargs_and_applied_echo():
+    from azure_search_server_core.client import _build_payload
+
+    rows = (
+        ("top", "top", 5, True),
+        ("skip", "skip", None, False),
+        ("include_total_count", None, True, False),
+        (None, "count", True, True),
+    )
+
+    assert _build_payload(rows, True) == ({"top": 5, "include_total_count": True}, {"top": 5, "count": True})
+    assert _build_payload(rows, False) == ({"top": 5, "include_total_count": True}, None)
+
+
+def test_simple_search_helpers_share_result_formatting(mocked_server):
+    module, _, mock_instance, _ = mocked_server
+    client = module.AzureSearchClient()
+
+    keyword = client.keyword_search("alpha", top=2)
+    assert keyword == [
+        {"title": "Doc1", "chunk": "Alpha", "@search.score": 1.0},
+        {"title": "Doc2", "chunk": "Beta", "@search.score": 0.8},
+    ]
+    assert mock_instance.search.call_args.kwargs == {"search_text": "alpha", "top": 2}
+
+    vector = client.vector_search("alpha", top=2)
+    assert vector == keyword
+    (query,) = mock_instance.search.call_args.kwargs["vector_queries"]
+    assert (query.text, query.fields, query.k_nearest_neighbors) == ("alpha", "text_vector", 50)
+
+
+def test_hybrid_search_serves_repeated_requests_from_cache(mocked_server):
+    module, _, mock_instance, _ = mocked_server
+    client = module.AzureSearchClient()
+    arguments = dict(vector_texts=["embedded"])
+
+    first = _search(client, **arguments)
+    second = _search(client, **arguments)
+    assert second == first
+    assert mock_instance.search.call_count == 1
+
+    _search(client, **arguments, include_scores=True)
+    _search(client, **arguments, vector_ks=[7])
+    assert mock_instance.search.call_count == 3
+
+    _search(client, **arguments, count=True)
+    _search(client, **arguments, count=True)
+    assert mock_instance.search.call_count == 5
+
+
+def test_hybrid_search_formats_cached_rows_with_cleaned_select(mocked_server):
+    module, _, mock_instance, _ = mocked_server
+    client = module.AzureSearchClient()
+
+    first = _search(client, select_fields=[" title ", "chunk"])
+    second = _search(client, select_fields=["title", "chunk"])
+
+    assert mock_instance.search.call_args.kwargs["select"] == "title,chunk"
+    assert mock_instance.search.call_count == 1
+    assert first == second
+    assert first["items"][0] == {"title": "Doc1", "chunk": "Alpha"}
+
+
+def test_hybrid_search_serves_near_duplicates_from_semantic_cache(mocked_server, monkeypatch):
+    pytest.importorskip("numpy")
+    from azure_search_server_core import semantic_cache
+
+    module, _, mock_instance, _ = mocked_server
+    vectors = {"reset password": [1.0, 0.0], "password reset": [0.99, 0.05], "pricing": [0.0, 1.0]}
+    monkeypatch.setattr(semantic_cache, "_load_embedder", lambda: vectors.__getitem__)
+    monkeypatch.setenv("AZURE_SEARCH_SEMANTIC_CACHE", "1")
+    client = module.AzureSearchClient()
+
+    def run(text):
+        return _search(client, search_text=text)
+
+    first = run("reset password")
+    assert run("password reset") == first
+    assert mock_instance.search.call_count == 1
+
+    run("pricing")
+    assert mock_instance.search.call_count == 2
+
+
+def test_hybrid_search_falls_back_when_semantic_cache_embedding_fails(mocked_server, monkeypatch):
+    pytest.importorskip("numpy")
+    from azure_search_server_core import semantic_cache
+
+    module, _, mock_instance, _ = mocked_server
+
+    def broken_embedder(text):
+        raise RuntimeError("embedding backend unavailable")
+
+    monkeypatch.setattr(semantic_cache, "_load_embedder", lambda: broken_embedder)
+    monkeypatch.setenv("AZURE_SEARCH_SEMANTIC_CACHE", "1")
+    monkeypatch.setenv("AZURE_SEARCH_RESULT_CACHE_TTL", "0")
+    assert module.AzureSearchClient()._semantic_cache is None
+
+    monkeypatch.delenv("AZURE_SEARCH_RESULT_CACHE_TTL")
+    client = module.AzureSearchClient()
+    assert client._semantic_cache is not None
+
+    result = _search(client, search_text="reset password")
+
+    assert [item["chunk"] for item in result["items"]][:1] == ["Alpha"]
+    assert mock_instance.search.call_count == 1
+
+
+def test_reciprocal_rank_fusion_merges_duplicates_and_weights_branches():
+    from azure_search_server_core.client import _reciprocal_rank_fusion
+
+    lexical = [{"chunk": "a", "@search.score": 9.0}, {"chunk": "b", "@search.score": 5.0}]
+    vector = [{"chunk": "b", "@search.score": 0.9}, {"chunk": "c", "@search.score": 0.8}]
+
+    fused = _reciprocal_rank_fusion([lexical, vector], [1.0, 2.0], top=2)
+
+    assert [row["chunk"] for row in fused] == ["b", "c"]
+    assert fused[0]["@search.score"] == pytest.approx(1 / 62 + 2 / 61)
+
+
+def test_reciprocal_rank_fusion_matches_documents_by_key_field():
+    from azure_search_server_core.client import _reciprocal_rank_fusion
+
+    lexical = [{"id": "1", "chunk": "a", "@search.highlights": {"chunk": ["<em>a</em>"]}}]
+    vector = [{"id": "1", "chunk": "a"}, {"id": "2", "chunk": "a"}]
+
+    fused = _reciprocal_rank_fusion([lexical, vector], [1.0, 1.0], top=5, key_field="id")
+
+    assert [row["id"] for row in fused] == ["1", "2"]
+    assert fused[0]["@search.score"] == pytest.approx(2 / 61)
+
+
+def test_hybrid_search_fans_out_vector_queries_when_enabled(mocked_server, monkeypatch):
+    module, _, mock_instance, _ = mocked_server
+    monkeypatch.setenv("AZURE_SEARCH_FANOUT", "1")
+    monkeypatch.setenv("AZURE_SEARCH_RESULT_CACHE_TTL", "0")
+    branch_rows = {
+        "alpha": [{"chunk": "A"}, {"chunk": "B"}],
+        "beta": [{"chunk": "B"}],
+        None: [{"chunk": "C"}],
+    }
+
+    def fake_search(**kwargs):
+        queries = kwargs.get("vector_queries")
+        return FakePaged(items=branch_rows[queries[0].text if queries else None], count=0)
+
+    mock_instance.search.side_effect = fake_search
+    client = module.AzureSearchClient()
+    arguments = dict(vector_texts=["alpha", "beta"])
+
+    payload = _search(client, **arguments, vector_ks=[10, 3], vector_filter_mode="preFilter")
+
+    assert mock_instance.search.call_count == 3
+    calls = [call.kwargs for call in mock_instance.search.call_args_list]
+    assert sum("search_text" in kwargs for kwargs in calls) == 1
+    assert all(len(kwargs.get("vector_queries", [])) <= 1 for kwargs in calls)
+    depths = {kwargs["vector_queries"][0].text if "vector_queries" in kwargs else None: kwargs["top"] for kwargs in calls}
+    assert depths == {"alpha": 10, "beta": 5, None: 10}
+    lexical_call = next(kwargs for kwargs in calls if "search_text" in kwargs)
+    assert "vector_filter_mode" not in lexical_call
+    assert all(kwargs.get("vector_filter_mode") == "preFilter" for kwargs in calls if kwargs is not lexical_call)
+    assert [item["chunk"] for item in payload["items"]] == ["B", "A", "C"]
+
+    _search(client, **arguments, count=True)
+    assert mock_instance.search.call_count == 4
+    assert len(mock_instance.search.call_args.kwargs["vector_queries"]) == 2
+
+
+def test_result_cache_size_comes_from_env(mocked_server, monkeypatch):
+    module, _, _, _ = mocked_server
+
+    monkeypatch.setenv("AZURE_SEARCH_RESULT_CACHE_SIZE", "8")
+    assert module.AzureSearchClient()._result_cache.maxsize == 8
+
+    monkeypatch.setenv("AZURE_SEARCH_RESULT_CACHE_SIZE", "0")
+    assert module.AzureSearchClient()._result_cache is None
+
+
+def test_prefetch_pages_yields_every_row_in_order():
+    from azure_search_server_core.client import _prefetch_pages
+
+    class PagedStub:
+        def __init__(self, pages):
+            self._pages = pages
+
+        def by_page(self):
+            return (iter(page) for page in self._pages)
+
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}], [{"id": 4}]]
+
+    assert [row["id"] for row in _prefetch_pages(PagedStub(pages))] == [1, 2, 3, 4]
+
+
+def test_hybrid_search_repeats_last_vector_k_and_defaults_weight(mocked_server, caplog):
+    module, _, mock_instance, _ = mocked_server
+
+    caplog.set_level(logging.DEBUG, logger="azure_search_server_core")
+    client = module.AzureSearchClient()
+
+    payload = _search(client, search_text=None, vector_texts=["alpha", "beta", "gamma"], vector_ks=[10, None])
+
+    call_kwargs = mock_instance.search.call_args.kwargs
+    assert call_kwargs["select"] == "chunk,FullName"
+    assert call_kwargs["select"] is client._default_select_value
+    assert "facets" not in call_kwargs
+
+    vector_queries = call_kwargs["vector_queries"]
+    assert [query.k_nearest_neighbors for query in vector_queries] == [10, 55, 55]
+    assert [query.weight for query in vector_queries] == [1.1, 1.1, 1.1]
+    assert payload["applied"]["vector_ks"] == [10, 55, 55]
+    assert payload["applied"]["select"] == "chunk,FullName"
+    assert "search_mode" not in payload["applied"]
+    assert "facets" not in payload["applied"]
+    assert "'vector_queries': '<3 vector queries>'" in caplog.text
+
+
+def test_hybrid_search_collapses_repeated_vector_texts(mocked_server):
+    module, _, mock_instance, _ = mocked_server
+    client = module.AzureSearchClient()
+
+    _search(
+        client,
+        search_text=None,
+        vector_texts=["firmware", "firmware", "drivers", "drivers", "US", "us"],
+        vector_ks=[10, 40, 20, 20, 5, 5],
+        vector_weights=[1.0, 0.5, 2.0, 2.0, 1.0, 1.0],
+        vector_rewrites=[None, None, None, "generative|count-3", None, None],
+    )
+
+    vector_queries = mock_instance.search.call_args.kwargs["vector_queries"]
+    assert [
+        (query.text, query.k_nearest_neighbors, query.weight, query.query_rewrites) for query in vector_queries
+    ] == [
+        ("firmware", 40, 1.5, None),
+        ("drivers", 20, 2.0, None),
+        ("drivers", 20, 2.0, "generative|count-3"),
+        ("US", 5, 1.0, None),
+        ("us", 5, 1.0, None),
+    ]
+
+
+def test_client_uses_pooled_transport(mocked_server):
+    from azure.core.pipeline.transport import RequestsTransport  # type: ignore[import]
+
+    module, mock_search_cls, _, _ = mocked_server
+
+    module.AzureSearchClient()
+
+    kwargs = mock_search_cls.call_args.kwargs
+    transport = kwargs["transport"]
+    assert isinstance(transport, RequestsTransport)
+    adapter = transport.session.get_adapter("https://example.search.windows.net")
+    assert adapter._pool_maxsize == 32
+    assert transport.connection_config.timeout == 5
+    assert transport.connection_config.read_timeout == 30
+    assert kwargs["retry_total"] == 5
+
+
+def test_pool_size_comes_from_env(mocked_server, monkeypatch):
+    module, mock_search_cls, _, _ = mocked_server
+    monkeypatch.setenv("AZURE_SEARCH_POOL_MAXSIZE", "64")
+
+    module.AzureSearchClient()
+
+    transport = mock_search_cls.call_args.kwargs["transport"]
+    assert transport.session.get_adapter("https://example.search.windows.net")._pool_maxsize == 64
+
+
+def test_clients_share_one_sdk_client(mocked_server):
+    module, mock_search_cls, _, _ = mocked_server
+
+    first = module.AzureSearchClient()
+    second = module.AzureSearchClient()
+
+    assert first.search_client is second.search_client
+    assert mock_search_cls.call_count == 1
+    assert module.AzureSearchClient.instance() is module.AzureSearchClient.instance()
+
+
+def test_warm_up_issues_one_minimal_query_and_swallows_errors(mocked_server):
+    module, _, mock_instance, _ = mocked_server
+
+    client = module.AzureSearchClient()
+    client.warm_up()
+
+    assert mock_instance.search.call_args.kwargs == {"search_text": "*", "top": 1, "select": "chunk,FullName"}
+
+    mock_instance.search.side_effect = RuntimeError("service unreachable")
+    client.warm_up()
@@ -0,0 +1,95 @@
+import io
+import json
+import sys
+
+import pytest  # type: ignore[import]
+
+from azure_search_server_core.tools import query_runner
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_load_payload_reads_json_file(tmp_path):
+    path = tmp_path / "payload.json"
+    path.write_text('{"search": "café", "top": 3}', encoding="utf-8")
+
+    assert query_runner._load_payload(path) == {"search": "café", "top": 3}
+
+
+@pytest.mark.parametrize("raw, message", [("", "Provide a JSON payload"), ("[1, 2]", "must be a JSON object")])
+def test_load_payload_rejects_empty_and_non_object_payloads(tmp_path, raw, message):
+    path = tmp_path / "payload.json"
+    path.write_text(raw, encoding="utf-8")
+
+    with pytest.raises(SystemExit, match=message):
+        query_runner._load_payload(path)
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_dump_result_writes_utf8_json_line(capsysbinary, pretty):
+    result = {"searchType": "Search", "items": [{"chunk": "café", "@search.score": 1.5}], "count": None}
+
+    query_runner._dump_result(result, pretty)
+
+    out = capsysbinary.readouterr().out
+    assert out.endswith(b"\n")
+    assert json.loads(out.decode("utf-8")) == result
+    assert (b"\n  " in out) is pretty
+
+
+def test_dump_result_falls_back_to_text_stdout(monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr(query_runner.sys, "stdout", stdout)
+
+    query_runner._dump_result({"chunk": "café"}, pretty=False)
+
+    assert stdout.getvalue() == '{"chunk":"café"}\n'
+
+
+def test_load_payload_reads_stdin_bytes(monkeypatch):
+    class _Stdin:
+        buffer = io.BytesIO('{"search": "naïve"}'.encode("utf-8"))
+
+        def isatty(self):
+            return False
+
+    monkeypatch.setattr(query_runner.sys, "stdin", _Stdin())
+
+    assert query_runner._load_payload(None) == {"search": "naïve"}
+
+
+def test_parser_is_built_once():
+    parser = query_runner._parser()
+
+    assert query_runner._parser() is parser
+    args = parser.parse_args(["--pretty"])
+    assert args.pretty is True and args.payload is None
+
+
+def test_jsonl_mode_runs_every_payload_through_one_search_import(tmp_path, monkeypatch, capsysbinary):
+    from types import SimpleNamespace
+
+    calls = []
+
+    def fake_search(**payload):
+        calls.append(payload)
+        return {"searchType": "Search", "items": [payload["search"]]}
+
+    monkeypatch.setitem(sys.modules, "azure_search_server", SimpleNamespace(search=fake_search))
+    path = tmp_path / "payloads.jsonl"
+    path.write_text('{"search": "alpha"}\n\n{"search": "beta", "top": 2}\n', encoding="utf-8")
+
+    assert query_runner.main(["--jsonl", "--pretty", "--payload", str(path)]) == 0
+
+    assert calls == [{"search": "alpha"}, {"search": "beta", "top": 2}]
+    lines = capsysbinary.readouterr().out.splitlines()
+    assert [json.loads(line)["items"] for line in lines] == [["alpha"], ["beta"]]
+
+
+def test_jsonl_mode_reports_the_offending_line(tmp_path):
+    path = tmp_path / "payloads.jsonl"
+    path.write_text('{"search": "alpha"}\n[1]\n', encoding="utf-8")
+
+    with pytest.raises(SystemExit, match="Payload on line 2 must be a JSON object"):
+        list(query_runner._iter_payloads(path))
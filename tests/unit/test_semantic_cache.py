@@ -0,0 +1,38 @@
+import pytest  # type: ignore[import]
+
+from azure_search_server_core import semantic_cache
+
+
+pytestmark = pytest.mark.unit
+
+
+def _cache(**kwargs):
+    pytest.importorskip("numpy")
+    vectors = {"reset password": [1.0, 0.0], "password reset": [0.99, 0.05], "pricing": [0.0, 1.0]}
+    return semantic_cache._SemanticCache(vectors.__getitem__, **kwargs)
+
+
+def test_semantic_cache_matches_near_duplicates_within_scope():
+    cache = _cache(capacity=4)
+
+    cache.put(cache.embed("reset password"), ("top", 5), {"items": ["doc"]})
+
+    assert cache.get(cache.embed("password reset"), ("top", 5)) == {"items": ["doc"]}
+    assert cache.get(cache.embed("password reset"), ("top", 10)) is None
+    assert cache.get(cache.embed("pricing"), ("top", 5)) is None
+
+
+def test_semantic_cache_overwrites_oldest_slot_when_full():
+    cache = _cache(capacity=1)
+
+    cache.put(cache.embed("reset password"), "scope", "old")
+    cache.put(cache.embed("pricing"), "scope", "new")
+
+    assert cache.get(cache.embed("reset password"), "scope") is None
+    assert cache.get(cache.embed("pricing"), "scope") == "new"
+
+
+def test_semantic_cache_is_disabled_without_embedding_backend(monkeypatch):
+    monkeypatch.setattr(semantic_cache, "_load_embedder", lambda: None)
+
+    assert semantic_cache._create_semantic_cache(60.0) is None
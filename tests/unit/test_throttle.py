@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+import pytest  # type: ignore[import]
+from azure.core.exceptions import HttpResponseError  # type: ignore[import]
+
+from azure_search_server_core import throttle
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(throttle.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(throttle.time, "sleep", fake_sleep)
+    return now, sleeps
+
+
+def test_gate_paces_bursts_and_rejects_long_waits(clock):
+    _, sleeps = clock
+    gate = throttle._RequestGate(max_qps=2)
+
+    gate.acquire()
+    gate.acquire()
+    assert sleeps == []
+
+    gate.acquire()
+    assert sleeps == [0.5]
+
+    gate.acquire(tokens=10)
+    assert sleeps == [0.5, 1.0]
+
+    with pytest.raises(throttle._ThrottledError):
+        gate.acquire()
+
+
+def test_gate_admits_requests_below_one_per_second(clock):
+    now, sleeps = clock
+    gate = throttle._RequestGate(max_qps=0.2)
+
+    gate.acquire()
+    with pytest.raises(throttle._ThrottledError):
+        gate.acquire()
+
+    now[0] += 5
+    gate.acquire()
+    assert sleeps == []
+
+
+def test_gate_admits_fanout_larger_than_bucket(clock):
+    now, sleeps = clock
+    gate = throttle._RequestGate(max_qps=1)
+
+    gate.acquire(tokens=3)
+    assert sleeps == []
+    with pytest.raises(throttle._ThrottledError):
+        gate.acquire()
+
+    now[0] += 3
+    gate.acquire()
+    assert sleeps == []
+
+
+def test_gate_opens_breaker_on_429(clock):
+    now, _ = clock
+    gate = throttle._RequestGate(max_qps=100)
+    response = SimpleNamespace(status_code=429, reason="Too Many Requests", headers={"Retry-After": "7"})
+
+    with pytest.raises(HttpResponseError):
+        with gate.guard():
+            raise HttpResponseError(response=response)
+
+    with pytest.raises(throttle._ThrottledError, match="retry in 7.0s"):
+        gate.acquire()
+
+    now[0] += 7
+    gate.acquire()
+
+
+def test_guarded_is_a_no_op_without_gate():
+    with throttle._guarded(None):
+        pass
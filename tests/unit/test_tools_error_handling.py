@@ -18,4 +18,139 @@ def test_tools_return_error_when_client_not_initialized(monkeypatch):
         assert payload.get("error") is not None
         assert expected in payload["error"]
 
+    # Each call gets its own dict, so mutating one response cannot leak into the next.
+    msg_lexical["error"] = "changed"
+    assert expected in server.search(search="test", vectors=None, top=1)["error"]
 
+
+@pytest.mark.unit
+def test_tool_raises_type_error_for_unknown_arguments(monkeypatch):
+    import azure_search_server as server
+
+    from azure_search_server_core.tools import query_runner
+
+    monkeypatch.setattr(server, "search_client", object(), raising=False)
+
+    with pytest.raises(TypeError, match="bogus"):
+        server.search(search="test", bogus=1)
+
+    # The query runner turns that into its own message instead of a logged traceback.
+    monkeypatch.setattr(query_runner, "_load_payload", lambda path: {"search": "test", "bogus": 1})
+    with pytest.raises(SystemExit, match="Payload keys do not match search tool signature"):
+        query_runner.main([])
+
+
+@pytest.mark.unit
+def test_tool_reports_validation_and_client_errors(monkeypatch):
+    import azure_search_server as server
+
+    class FailingClient:
+        def hybrid_search(self, **kwargs):
+            raise RuntimeError("service unavailable")
+
+    monkeypatch.setattr(server, "search_client", FailingClient(), raising=False)
+
+    empty = server.search(search="  ", vectors=None, top=1)
+    assert empty["error"].startswith("Provide either a lexical `search` query")
+    assert empty["searchType"] == "Search"
+
+    blank_vectors = server.search(search=None, vectors=["  "], top=1)
+    assert blank_vectors["error"] == empty["error"]
+
+    failed = server.search(search="test", vectors=None, top=1)
+    assert failed["error"] == "Error performing search: service unavailable"
+
+
+@pytest.mark.unit
+def test_mcp_tool_runs_search_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    import azure_search_server as server
+
+    seen = {}
+
+    class RecordingClient:
+        def hybrid_search(self, **kwargs):
+            seen["thread"] = threading.get_ident()
+            return {"results": [], "count": None, "facets": None, "answers": None, "applied": None}
+
+    monkeypatch.setattr(server, "search_client", RecordingClient(), raising=False)
+
+    asyncio.run(server.mcp.call_tool("search", {"search": "test", "top": 1}))
+
+    assert seen["thread"] != threading.get_ident()
+
+
+@pytest.mark.unit
+def test_multi_search_tool_runs_payloads_and_keeps_order(monkeypatch):
+    import asyncio
+    import json
+
+    import azure_search_server as server
+
+    calls = []
+
+    class EchoClient:
+        def hybrid_search(self, **kwargs):
+            calls.append(kwargs)
+            return {"items": [{"chunk": kwargs["search_text"]}], "count": None, "facets": None, "applied": None}
+
+    monkeypatch.setattr(server, "search_client", EchoClient(), raising=False)
+
+    content, _ = asyncio.run(
+        server.mcp.call_tool(
+            "multi_search",
+            {
+                "queries": [
+                    {"search": "first", "top": "3", "count": "true"},
+                    {"search": "second"},
+                    {"search": "x", "bogus": 1},
+                    {"search": " "},
+                    {"search": "x", "top": 99999, "skip": -3, "count": "false"},
+                ]
+            },
+        )
+    )
+    payload = json.loads(content[0].text)
+
+    assert payload["searchType"] == "MultiSearch"
+    first, second, bogus, empty, out_of_range = payload["results"]
+    assert first["items"] == [{"chunk": "first"}]
+    assert second["items"] == [{"chunk": "second"}]
+    assert bogus["error"] == "Unknown search arguments: bogus"
+    assert empty["error"].startswith("Provide either a lexical `search` query")
+    assert out_of_range["error"].startswith("Invalid search arguments: ")
+    assert "top" in out_of_range["error"] and "skip" in out_of_range["error"]
+
+    # Payloads are coerced exactly like single `search` calls; rejected ones never reach the client.
+    assert len(calls) == 2
+    first_call = next(call for call in calls if call["search_text"] == "first")
+    assert first_call["top"] == 3 and first_call["count"] is True
+
+
+@pytest.mark.unit
+def test_tool_logs_service_errors_without_traceback(monkeypatch, caplog):
+    import logging
+    from types import SimpleNamespace
+
+    from azure.core.exceptions import HttpResponseError  # type: ignore[import]
+
+    import azure_search_server as server
+
+    response = SimpleNamespace(status_code=429, reason="Too Many Requests", headers={})
+
+    class ThrottledClient:
+        def hybrid_search(self, **kwargs):
+            raise HttpResponseError(message="throttled", response=response)
+
+    monkeypatch.setattr(server, "search_client", ThrottledClient(), raising=False)
+    caplog.set_level(logging.WARNING, logger="azure_search_server_core")
+
+    payload = server.search(search="test", vectors=None, top=1)
+
+    assert payload["error"] == "Error performing search: throttled"
+    [record] = [r for r in caplog.records if r.name == "azure_search_server_core.tools.search"]
+    assert record.levelno == logging.WARNING
+    assert "status 429" in record.getMessage()
+    assert record.exc_info is None
@@ -0,0 +1,164 @@
+import math
+
+import pytest  # type: ignore[import]
+
+from azure_search_server_core import utils
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("chunk", ["chunk"]),
+        ("  chunk  ", ["chunk"]),
+        ("chunk, FullName", ["chunk", "FullName"]),
+        ("chunk\nFullName,,title\n", ["chunk", "FullName", "title"]),
+        ('["chunk", "FullName"]', ["chunk", "FullName"]),
+        ('["chunk"]', ["chunk"]),
+        ("[ ]", []),
+        ("", []),
+        (None, []),
+    ],
+)
+def test_ensure_list_of_strings_splits_on_commas_and_newlines(raw, expected):
+    assert utils._ensure_list_of_strings(raw) == expected
+
+
+def test_ensure_list_of_ints_casts_each_part():
+    assert utils._ensure_list_of_ints("10, 20\n30") == [10, 20, 30]
+    assert utils._ensure_list_of_ints("7") == [7]
+    assert utils._ensure_list_of_ints("0,\n1") == [0, 1]
+
+
+def test_field_helpers_drop_blank_entries():
+    assert utils._list_to_field_value([" chunk ", "", "  "]) == ["chunk"]
+    assert utils._list_to_field_value(["", " "]) is None
+    assert utils._vector_field_selector([" text_vector "]) == "text_vector"
+    assert utils._vector_field_selector(["a", " ", "b"]) == "a,b"
+    assert utils._vector_field_selector([]) == "text_vector"
+
+
+def test_join_fields_caches_joined_select():
+    assert utils._join_fields((" chunk", "FullName ", "")) == "chunk,FullName"
+    assert utils._join_fields((" ",)) is None
+    assert utils._join_fields(("a", "b")) is utils._join_fields(("a", "b"))
+
+
+def test_ensure_list_of_strings_returns_clean_lists_unchanged():
+    clean = ["chunk", "FullName"]
+    assert utils._ensure_list_of_strings(clean) is clean
+
+    assert utils._ensure_list_of_strings([" chunk ", 5, None]) == ["chunk", "5"]
+
+
+def test_first_matches_coalesce():
+    assert utils._first(None, 2) == utils._coalesce(None, 2) == 2
+    assert utils._first(0, 2) == 0
+
+
+@pytest.mark.parametrize("raw, expected", [(" en-US ", "en-US"), ("   ", None), ("", None), (None, None), (5, None)])
+def test_clean_str(raw, expected):
+    assert utils._clean_str(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("60", 60),
+        (" -3 ", -3),
+        ("+7", 7),
+        (12, 12),
+        ("1_000", 1000),
+        ("1.5", None),
+        ("abc", None),
+        ("", None),
+        ("²", None),
+        (None, None),
+    ],
+)
+def test_try_parse_int(raw, expected):
+    assert utils._try_parse_int(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("1.5", 1.5),
+        ("2", 2.0),
+        (".5", 0.5),
+        ("-1e-3", -0.001),
+        (0.25, 0.25),
+        ("1_000.5", 1000.5),
+        ("+inf", float("inf")),
+        ("1.2.3", None),
+        ("x", None),
+        (None, None),
+    ],
+)
+def test_try_parse_float(raw, expected):
+    assert utils._try_parse_float(raw) == expected
+
+
+def test_try_parse_float_accepts_nan():
+    assert math.isnan(utils._try_parse_float("nan"))
+
+
+def test_semantic_option_parsers_cache_by_value():
+    payload, highlight = utils._parse_semantic_captions("extractive|highlight-true")
+    assert payload == {"query_caption": "extractive", "query_caption_highlight_enabled": True}
+    assert highlight is True
+    assert utils._parse_semantic_captions("extractive|highlight-true")[0] is payload
+
+    answers = utils._parse_semantic_answers("extractive|count-3|threshold-0.7")
+    assert answers == {"query_answer": "extractive", "query_answer_count": 3, "query_answer_threshold": 0.7}
+    assert utils._parse_semantic_answers("extractive|count-3|threshold-0.7") is answers
+
+
+def test_string_inputs_are_parsed_once_and_returned_as_fresh_lists():
+    utils._split_string_list.cache_clear()
+    utils._cached_vector_descriptors.cache_clear()
+
+    first = utils._ensure_list_of_strings("chunk, title")
+    first.append("mutated")
+    assert utils._ensure_list_of_strings("chunk, title") == ["chunk", "title"]
+    assert utils._split_string_list.cache_info().hits == 1
+
+    assert utils._normalize_vector_descriptors(["alpha", " beta "]) == [("alpha", None, None, None), ("beta", None, None, None)]
+    assert utils._normalize_vector_descriptors(("alpha", " beta ")) == utils._normalize_vector_descriptors(["alpha", " beta "])
+    assert utils._cached_vector_descriptors.cache_info().hits == 2
+    assert utils._normalize_vector_descriptors([["alpha", "5", "0.5"]]) == [("alpha", 5, 0.5, None)]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('["category,count:5", " type "]', ["category,count:5", "type"]),
+        ("category,count:5\n\ntype", ["category,count:5", "type"]),
+        ("   ", []),
+        (["a", " "], ["a"]),
+    ],
+)
+def test_ensure_list_of_facets_keeps_commas_inside_facets(raw, expected):
+    assert utils._ensure_list_of_facets(raw) == expected
+    assert utils._ensure_list_of_facets(raw) is not utils._ensure_list_of_facets(raw)
+
+
+def test_ensure_list_of_facets_returns_clean_lists_unchanged():
+    clean = ["category,count:5", "type"]
+    assert utils._ensure_list_of_facets(clean) is clean
+
+
+def test_nested_vector_descriptors_are_cached_without_conflating_numbers():
+    utils._cached_vector_descriptors.cache_clear()
+
+    assert utils._normalize_vector_descriptors([["alpha", 5, 0.5], "beta"]) == [
+        ("alpha", 5, 0.5, None),
+        ("beta", None, None, None),
+    ]
+    assert utils._normalize_vector_descriptors([("alpha", "5", "0.5"), "beta"])[0] == ("alpha", 5, 0.5, None)
+    assert utils._cached_vector_descriptors.cache_info().hits == 1
+
+    assert utils._normalize_vector_descriptors([["alpha", 5.0]]) == [("alpha", None, None, None)]
+    assert utils._normalize_vector_descriptors([["alpha", {"k": 5}]]) == [("alpha", None, None, None)]